@@ -25,31 +25,35 @@ def create_julia_animation():
     fig, ax = plt.subplots(figsize=(8, 8))
     ax.axis('off')
     
-    # Initial image
-    image = renderer.render(progressive=False)
-    im = ax.imshow(image)
+    # Every frame is rendered into this buffer, so the image artist keeps
+    # the same array for the whole animation
+    frame_buffer = np.empty((renderer.height, renderer.width, 3), dtype=np.uint8)
+    renderer.render(progressive=False, out=frame_buffer)
+    im = ax.imshow(frame_buffer)
     
     # Animation parameters
     n_frames = 100
     
+    # Circular path of c in the complex plane, computed once for all frames
+    t = np.linspace(0, 2 * np.pi, n_frames, endpoint=False)
+    c_reals = (0.7885 * np.cos(t)).tolist()
+    c_imags = (0.7885 * np.sin(t)).tolist()
+    
     def animate(frame):
         """Update function for animation."""
-        # Calculate c parameter based on frame
-        t = 2 * np.pi * frame / n_frames
-        
-        # Circular path in complex plane
-        c_real = 0.7885 * np.cos(t)
-        c_imag = 0.7885 * np.sin(t)
+        c_real = c_reals[frame]
+        c_imag = c_imags[frame]
         
         # Render with new parameters
-        image = renderer.render(
+        renderer.render(
             progressive=False,
+            out=frame_buffer,
             c_real=c_real,
             c_imag=c_imag,
             max_iter=256
         )
         
-        im.set_array(image)
+        im.set_data(frame_buffer)
         ax.set_title(f"Julia Set: c = {c_real:.3f} + {c_imag:.3f}i")
         
         if frame % 10 == 0:
@@ -57,10 +61,11 @@ def create_julia_animation():
         
         return [im]
     
-    # Create animation
+    # Create animation; blitting is off because the title changes every
+    # frame and blitting only redraws the returned image artist
     print("Creating animation (this may take a while)...")
     anim = FuncAnimation(fig, animate, frames=n_frames, 
-                        interval=50, blit=True, repeat=True)
+                        interval=50, blit=False, repeat=True)
     
     # Save as GIF (requires pillow or imagemagick)
     output_file = "julia_animation.gif"
@@ -1,8 +1,21 @@
 """Fractal Explorer - Interactive multi-fractal visualization framework."""
 
+import os
+
+# Kernels are launched from render and warmup threads. Numba's TBB layer
+# hangs at interpreter exit after a launch from a non-main thread, so prefer
+# OpenMP when it is available; set before numba is first imported
+os.environ.setdefault("NUMBA_THREADING_LAYER_PRIORITY", "omp tbb workqueue")
+
 __version__ = "0.1.0"
 __author__ = "Fractal Explorer Team"
 
-from .app import FractalExplorer
+__all__ = ["FractalExplorer"]
+
 
-__all__ = ["FractalExplorer"]
\ No newline at end of file
+def __getattr__(name):
+    """Import the Qt application class only when it is first requested."""
+    if name == "FractalExplorer":
+        from .app import FractalExplorer
+        return FractalExplorer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
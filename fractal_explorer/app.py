@@ -1,9 +1,6 @@
 """Main application class for Fractal Explorer."""
 
 import sys
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from .ui.main_window import FractalExplorerWindow
 
 
 class FractalExplorer:
@@ -16,10 +13,22 @@ class FractalExplorer:
         
     def run(self):
         """Run the application."""
+        # Qt and the UI are imported here so headless users of the package
+        # do not pay for them
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtCore import Qt
+        from .ui.main_window import FractalExplorerWindow
+        
         # Enable high DPI support BEFORE creating QApplication
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
         
+        # Use fractional scale factors as-is (Qt 5.14+) so the canvas is not
+        # rendered at a rounded size and rescaled on every repaint
+        if hasattr(QApplication, 'setHighDpiScaleFactorRoundingPolicy'):
+            QApplication.setHighDpiScaleFactorRoundingPolicy(
+                Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+        
         # Create Qt application
         self.app = QApplication(sys.argv)
         
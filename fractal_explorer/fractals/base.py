@@ -1,13 +1,286 @@
 """Base classes for all fractal implementations."""
 
+import math
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Any, Tuple, Optional, Callable
 import numpy as np
+from numba import jit, prange, get_num_threads
+
+
+# Tile edge (as a power of two) used when bucketing IFS points by tile
+IFS_TILE_SHIFT = 6
+
+# Number of points buffered before a tiled splat
+IFS_TILE_BUFFER = 65536
+
+# Result size in bytes above which IFS points are bucketed by tile
+IFS_TILE_MIN_BYTES = 4 * 1024 * 1024
+
+# Memory budget for the per-chain histograms of a parallel IFS render
+IFS_CHAIN_MAX_BYTES = 256 * 1024 * 1024
+
+# Fewest plotted iterations worth giving their own chain
+IFS_MIN_CHAIN_ITERATIONS = 50000
+
+# Row length of the kernel coefficient table; padding the six affine
+# coefficients to eight float64 values gives each transform one cache line
+IFS_COEFF_STRIDE = 8
+
+
+@jit(nopython=True, inline='always')
+def splat_bilinear(result: np.ndarray, fx: float, fy: float):
+    """Accumulate one point into the result with bilinear anti-aliasing.
+    
+    Args:
+        result: 2D accumulation array, updated in place
+        fx: Point x position in pixel units
+        fy: Point y position in pixel units (increasing upwards)
+    """
+    height, width = result.shape
+    px = int(fx)
+    py = int(fy)
+    
+    if 0 <= px < width-1 and 0 <= py < height-1:
+        # Distribute the point weight across 4 neighboring pixels
+        dx = fx - px
+        dy = fy - py
+        row = height - 1 - py
+        
+        result[row, px] += (1 - dx) * (1 - dy)
+        result[row, px + 1] += dx * (1 - dy)
+        result[row - 1, px] += (1 - dx) * dy
+        result[row - 1, px + 1] += dx * dy
+    elif 0 <= px < width and 0 <= py < height:
+        # Fall back to single pixel for edge cases
+        result[height - 1 - py, px] += 1
+
+
+@jit(nopython=True, inline='always')
+def normalize_log_density(result: np.ndarray):
+    """Log-scale a density histogram into [0, 1] in place.
+    
+    log1p is monotonic, so the maximum of the scaled image is known from
+    the raw maximum and a single fused pass does the rest.
+    
+    Args:
+        result: 2D accumulation array, updated in place
+    """
+    peak = result.max()
+    if peak > 0:
+        scale = 1.0 / np.log1p(peak)
+        for i in range(result.shape[0]):
+            for j in range(result.shape[1]):
+                result[i, j] = np.log1p(result[i, j]) * scale
+
+
+@jit(nopython=True, inline='always')
+def lcg_next(state: np.uint64) -> np.uint64:
+    """Advance a 64-bit linear congruential generator.
+    
+    Uses Knuth's MMIX constants; the high 32 bits of the state are the
+    usable random output.
+    
+    Args:
+        state: Current generator state
+        
+    Returns:
+        Next generator state
+    """
+    return state * np.uint64(6364136223846793005) + np.uint64(1442695040888963407)
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def splat_by_tile(result: np.ndarray, fxs: np.ndarray, fys: np.ndarray, count: int):
+    """Splat a buffer of points after bucketing them by image tile.
+    
+    Grouping the writes by tile keeps the working set of the scatter
+    inside a cache-sized block of the result instead of striding over
+    the whole image for every point.
+    
+    Args:
+        result: 2D accumulation array, updated in place
+        fxs: Point x positions in pixel units
+        fys: Point y positions in pixel units
+        count: Number of valid points in the buffers
+    """
+    height, width = result.shape
+    shift = IFS_TILE_SHIFT
+    tiles_x = (width >> shift) + 1
+    tiles_y = (height >> shift) + 1
+    
+    # Counting sort of the points by tile index
+    tile_ids = np.empty(count, dtype=np.int64)
+    offsets = np.zeros(tiles_x * tiles_y + 1, dtype=np.int64)
+    for j in range(count):
+        tile = (int(fys[j]) >> shift) * tiles_x + (int(fxs[j]) >> shift)
+        tile_ids[j] = tile
+        offsets[tile + 1] += 1
+        
+    for t in range(1, offsets.shape[0]):
+        offsets[t] += offsets[t - 1]
+        
+    order = np.empty(count, dtype=np.int64)
+    for j in range(count):
+        tile = tile_ids[j]
+        order[offsets[tile]] = j
+        offsets[tile] += 1
+        
+    for j in range(count):
+        splat_bilinear(result, fxs[order[j]], fys[order[j]])
+
+
+@jit(nopython=True, nogil=True, cache=True, fastmath=True)
+def ifs_chain(result: np.ndarray, coeffs: np.ndarray, cum_probs: np.ndarray,
+              iterations: int, skip: int, xmin: float, ymin: float,
+              scale_x: float, scale_y: float, seed: int, bin_by_tile: bool):
+    """Run one chaos-game chain and accumulate its points into a histogram.
+    
+    Args:
+        result: 2D accumulation array, updated in place
+        coeffs: (K, IFS_COEFF_STRIDE) table whose rows start with the affine
+            coefficients (a, b, c, d, e, f) of each transform
+        cum_probs: (K,) cumulative transform probabilities
+        iterations: Number of plotted iterations
+        skip: Number of initial iterations to discard
+        xmin, ymin: Coordinates of the lower-left corner
+        scale_x, scale_y: Pixels per coordinate unit
+        seed: Seed for the chain's random generator
+        bin_by_tile: Whether to buffer points and splat them tile by tile
+    """
+    height, width = result.shape
+    n_transforms = coeffs.shape[0]
+    
+    # Transform thresholds on the 32-bit random output, so choosing a
+    # transform is an integer comparison
+    thresholds = np.empty(n_transforms, dtype=np.uint64)
+    for m in range(n_transforms):
+        thresholds[m] = np.uint64(min(cum_probs[m], 1.0) * 4294967295.0)
+        
+    # Inline generator state, private to this chain
+    state = lcg_next(np.uint64(seed))
+    
+    # Point buffers for tiled splatting
+    buffer_size = IFS_TILE_BUFFER if bin_by_tile else 1
+    fxs = np.empty(buffer_size)
+    fys = np.empty(buffer_size)
+    buffered = 0
+    
+    # Starting point
+    x, y = 0.0, 0.0
+    
+    for i in range(iterations + skip):
+        # Choose transform by counting the thresholds below r, which
+        # compiles to a branchless compare-and-add sequence
+        state = lcg_next(state)
+        r = state >> np.uint64(32)
+        k = 0
+        for m in range(n_transforms - 1):
+            k += r >= thresholds[m]
+            
+        # Apply transform
+        row = coeffs[k]
+        x, y = (row[0] * x + row[1] * y + row[4],
+                row[2] * x + row[3] * y + row[5])
+        
+        if i < skip:
+            continue
+            
+        # Map to pixel coordinates with anti-aliasing
+        fx = (x - xmin) * scale_x
+        fy = (y - ymin) * scale_y
+        
+        # Small histograms stay cache-resident, so splatting each point as
+        # it lands beats staging a batch; large ones go through the tile bins
+        if not bin_by_tile:
+            splat_bilinear(result, fx, fy)
+        elif 0 <= fx < width and 0 <= fy < height:
+            fxs[buffered] = fx
+            fys[buffered] = fy
+            buffered += 1
+            if buffered == buffer_size:
+                splat_by_tile(result, fxs, fys, buffered)
+                buffered = 0
+                
+    if buffered > 0:
+        splat_by_tile(result, fxs, fys, buffered)
+
+
+@jit(nopython=True, nogil=True, parallel=True, cache=True, fastmath=True)
+def ifs_kernel(coeffs: np.ndarray, cum_probs: np.ndarray, iterations: int, skip: int,
+               xmin: float, xmax: float, ymin: float, ymax: float,
+               width: int, height: int, seed: int, bin_by_tile: bool = False,
+               n_chains: int = 1) -> np.ndarray:
+    """Optimized chaos-game kernel for any affine IFS.
+    
+    The iterations are split across independent chains that run in
+    parallel, each into its own histogram, and the histograms are summed.
+    
+    Args:
+        coeffs: (K, IFS_COEFF_STRIDE) table whose rows start with the affine
+            coefficients (a, b, c, d, e, f) of each transform
+        cum_probs: (K,) cumulative transform probabilities
+        iterations: Number of plotted iterations
+        skip: Number of initial iterations each chain discards
+        xmin, xmax, ymin, ymax: Coordinate bounds
+        width, height: Image dimensions
+        seed: Seed for the first chain; chain t uses seed + t
+        bin_by_tile: Whether to buffer points and splat them tile by tile
+        n_chains: Number of independent chains
+        
+    Returns:
+        2D array of the fractal
+    """
+    histograms = np.zeros((n_chains, height, width), dtype=np.float32)
+    
+    # Pixels per unit, hoisted so the loop multiplies instead of divides
+    scale_x = (width - 1) / (xmax - xmin)
+    scale_y = (height - 1) / (ymax - ymin)
+    
+    for t in prange(n_chains):
+        chain_iterations = iterations // n_chains + (t < iterations % n_chains)
+        ifs_chain(histograms[t], coeffs, cum_probs, chain_iterations, skip,
+                  xmin, ymin, scale_x, scale_y, (seed + t) % 2**32, bin_by_tile)
+        
+    # Reduce the per-chain histograms into the first one; each thread gets
+    # a contiguous block of rows from prange's default schedule
+    result = histograms[0]
+    for py in prange(height):
+        for t in range(1, n_chains):
+            for px in range(width):
+                result[py, px] += histograms[t, py, px]
+                
+    # Apply logarithmic scaling for better visualization
+    normalize_log_density(result)
+    
+    return result
+
+
+@lru_cache(maxsize=256)
+def _adaptive_iter(base_iter: int, zoom_bucket: float) -> int:
+    """Scale an iteration count logarithmically with a quantized zoom level."""
+    return min(int(base_iter * (1 + math.log10(max(1.0, zoom_bucket)))), 2000)
+
+
+@lru_cache(maxsize=128)
+def _adaptive_ifs_iter(base_iterations: int, zoom_level: float) -> int:
+    """Scale an IFS iteration count with zoom, capped at ten times the base."""
+    # Use a sub-linear power to avoid excessive iteration counts
+    zoom_factor = max(1.0, zoom_level ** 0.75)
+    
+    # Cap the maximum iterations to prevent excessive computation
+    max_iterations = min(base_iterations * 10, 10000000)
+    adjusted_iterations = int(base_iterations * zoom_factor)
+    
+    return min(adjusted_iterations, max_iterations)
 
 
 class Fractal(ABC):
     """Abstract base class for all fractal types."""
     
+    # Number of computed grids kept in the cache
+    GRID_CACHE_SIZE = 8
+    
     def __init__(self, name: str):
         """Initialize fractal with a name.
         
@@ -73,11 +346,56 @@ class Fractal(ABC):
     def clear_cache(self):
         """Clear any cached computations."""
         self._cache.clear()
+        
+    def cached_grid(self, key: tuple, compute_grid: Callable[[], np.ndarray]) -> np.ndarray:
+        """Get a computed grid from the cache, computing it on a miss.
+        
+        Grids depend only on the numeric inputs in the key, so palette
+        changes and repeated frames over the same view skip the kernel.
+        The least recently used grid is evicted once the cache is full.
+        
+        Args:
+            key: Hashable tuple of every input that affects the grid
+            compute_grid: Function computing the grid on a cache miss
+            
+        Returns:
+            Read-only 2D grid
+        """
+        grid = self._cache.pop(key, None)
+        if grid is None:
+            grid = compute_grid()
+            grid.setflags(write=False)
+            if len(self._cache) >= self.GRID_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+                
+        # Dicts keep insertion order, so reinserting marks the key as recent
+        self._cache[key] = grid
+        return grid
+        
+    def warmup(self):
+        """Compile this fractal's kernels by computing a tiny frame.
+        
+        Numba compiles each kernel (or loads it from its on-disk cache) on
+        first call, which takes around a second; doing it ahead of time keeps
+        that latency out of the first interactive render.
+        """
+        self.compute(16, 16, self.get_default_bounds(), adaptive_iter=False)
+        self.clear_cache()
 
 
 class EscapeTimeFractal(Fractal):
     """Base class for escape-time fractals like Mandelbrot and Julia sets."""
     
+    # Smallest pixel spacing at which preview renders may use float32
+    PREVIEW_MIN_SPACING = 1e-5
+    
+    # Whether compute() scales max_iter with the zoom level by default
+    ADAPTIVE_ITER = False
+    
+    # Edge length and cache capacity of the coordinate-aligned render tiles
+    TILE_SIZE = 64
+    TILE_CACHE_SIZE = 1024
+    
     def __init__(self, name: str, max_iter: int = 256):
         """Initialize escape-time fractal.
         
@@ -87,6 +405,8 @@ class EscapeTimeFractal(Fractal):
         """
         super().__init__(name)
         self.max_iter = max_iter
+        self._device_out = None
+        self._tiles = {}
         
     def get_type(self) -> str:
         """Return fractal type."""
@@ -105,6 +425,141 @@ class EscapeTimeFractal(Fractal):
             }
         }
     
+    def pixel_axes(self, width: int, height: int,
+                   bounds: Tuple[float, float, float, float],
+                   preview: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the fractal coordinates of each pixel column and row.
+        
+        Preview renders use float32 axes while the pixel spacing is coarse
+        enough for single precision, halving the kernel's working width.
+        
+        Args:
+            width: Width in pixels
+            height: Height in pixels
+            bounds: (xmin, xmax, ymin, ymax) coordinate bounds
+            preview: Whether reduced precision is acceptable
+            
+        Returns:
+            Tuple of (xs, ys) coordinate arrays
+        """
+        xmin, xmax, ymin, ymax = bounds
+        dx = (xmax - xmin) / width
+        dy = (ymax - ymin) / height
+        
+        dtype = np.float64
+        if preview and min(abs(dx), abs(dy)) > self.PREVIEW_MIN_SPACING:
+            dtype = np.float32
+            
+        xs = (xmin + np.arange(width) * dx).astype(dtype)
+        ys = (ymin + np.arange(height) * dy).astype(dtype)
+        return xs, ys
+    
+    def compute_cuda(self, kernel, width: int, height: int,
+                     bounds: Tuple[float, float, float, float], *args) -> np.ndarray:
+        """Run a per-pixel CUDA kernel over the view.
+        
+        The device output buffer is kept on the instance and reused while
+        the image size is unchanged, so repeated frames only pay for the
+        kernel launch and the copy back.
+        
+        Args:
+            kernel: CUDA kernel from utils.cuda.escape_time
+            width: Width in pixels
+            height: Height in pixels
+            bounds: (xmin, xmax, ymin, ymax) coordinate bounds
+            *args: Remaining kernel arguments (max_iter, constants)
+            
+        Returns:
+            2D array of iteration counts
+        """
+        from ..utils.cuda.escape_time import device_buffer, launch_2d
+        
+        xmin, xmax, ymin, ymax = bounds
+        self._device_out = device_buffer(self._device_out, width, height)
+        launch_2d(kernel, self._device_out, xmin, (xmax - xmin) / width,
+                  ymin, (ymax - ymin) / height, *args)
+        return self._device_out.copy_to_host()
+    
+    def compute_tiled(self, compute_tile: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                      width: int, height: int, bounds: Tuple[float, float, float, float],
+                      key: tuple) -> np.ndarray:
+        """Assemble the view from cached tiles on a fixed coordinate lattice.
+        
+        Pixels are snapped to a lattice of multiples of the pixel spacing, so
+        views at the same zoom share tiles and a pan only computes the tiles
+        that scrolled into view. The snap moves the view by under half a
+        pixel.
+        
+        Args:
+            compute_tile: Function computing a tile from its column and row
+                coordinates
+            width: Width in pixels
+            height: Height in pixels
+            bounds: (xmin, xmax, ymin, ymax) coordinate bounds
+            key: Hashable tuple of the other inputs that affect a tile
+            
+        Returns:
+            2D array of iteration counts
+        """
+        xmin, xmax, ymin, ymax = bounds
+        size = self.TILE_SIZE
+        
+        # Round the spacing so pans that shift the bounds by a few ulps
+        # still land on the same lattice
+        dx = float('%.12g' % ((xmax - xmin) / width))
+        dy = float('%.12g' % ((ymax - ymin) / height))
+        gx0 = round(xmin / dx)
+        gy0 = round(ymin / dy)
+        
+        result = np.empty((height, width), dtype=np.float32)
+        offsets = np.arange(size)
+        
+        for ty in range(gy0 // size, (gy0 + height - 1) // size + 1):
+            for tx in range(gx0 // size, (gx0 + width - 1) // size + 1):
+                tile_key = key + (dx, dy, tx, ty)
+                tile = self._tiles.pop(tile_key, None)
+                if tile is None:
+                    tile = compute_tile((tx * size + offsets) * dx,
+                                        (ty * size + offsets) * dy)
+                    if len(self._tiles) >= self.TILE_CACHE_SIZE:
+                        del self._tiles[next(iter(self._tiles))]
+                self._tiles[tile_key] = tile
+                
+                # Copy the part of the tile inside the view
+                y_lo = max(ty * size, gy0)
+                y_hi = min((ty + 1) * size, gy0 + height)
+                x_lo = max(tx * size, gx0)
+                x_hi = min((tx + 1) * size, gx0 + width)
+                result[y_lo - gy0:y_hi - gy0, x_lo - gx0:x_hi - gx0] = \
+                    tile[y_lo - ty * size:y_hi - ty * size, x_lo - tx * size:x_hi - tx * size]
+                    
+        return result
+    
+    def clear_cache(self):
+        """Clear any cached computations, including render tiles."""
+        super().clear_cache()
+        self._tiles.clear()
+    
+    def resolve_max_iter(self, bounds: Tuple[float, float, float, float],
+                         params: Dict[str, Any]) -> int:
+        """Get the iteration count compute() uses for a view.
+        
+        Callers computing part of a view pass the result back as max_iter
+        with adaptive_iter off, so the part matches the whole.
+        
+        Args:
+            bounds: (xmin, xmax, ymin, ymax) coordinate bounds
+            params: Parameters as passed to compute()
+            
+        Returns:
+            Maximum iterations
+        """
+        if self.ADAPTIVE_ITER and params.get('adaptive_iter', True):
+            # adaptive_iterations is memoized, so panning at a fixed zoom
+            # costs one cache lookup
+            return self.adaptive_iterations(4.0 / (bounds[1] - bounds[0]))
+        return params.get('max_iter', self.max_iter)
+    
     def adaptive_iterations(self, zoom_level: float) -> int:
         """Calculate adaptive iteration count based on zoom level.
         
@@ -114,8 +569,7 @@ class EscapeTimeFractal(Fractal):
         Returns:
             Adjusted maximum iterations
         """
-        base_iter = self.max_iter
-        return min(int(base_iter * (1 + np.log10(max(1, zoom_level)))), 2000)
+        return _adaptive_iter(self.max_iter, round(zoom_level, 3))
     
     @abstractmethod
     def escape_calculation(self, c: np.ndarray, max_iter: int) -> np.ndarray:
@@ -134,16 +588,32 @@ class EscapeTimeFractal(Fractal):
 class IFSFractal(Fractal):
     """Base class for Iterated Function System fractals."""
     
-    def __init__(self, name: str, iterations: int = 100000):
+    # Affine coefficient table with one (a, b, c, d, e, f) row per transform,
+    # for x' = a*x + b*y + e and y' = c*x + d*y + f, plus the matching
+    # transform probabilities. Subclasses may declare these instead of
+    # overriding get_transforms().
+    AFFINE: Optional[np.ndarray] = None
+    PROBS: Optional[np.ndarray] = None
+    
+    def __init__(self, name: str, iterations: int = 100000,
+                 seed: Optional[int] = None):
         """Initialize IFS fractal.
         
         Args:
             name: Human-readable name
             iterations: Number of iterations for IFS
+            seed: Seed for the chaos game, or None for a fresh random seed
         """
         super().__init__(name)
         self.iterations = iterations
         
+        # Seeds each kernel run, so a seeded fractal renders reproducibly
+        self._rng = np.random.default_rng(seed)
+        
+        # Transforms are fixed per instance, so build them once
+        self._transforms = None
+        self._affine_tables = None
+        
     def get_type(self) -> str:
         """Return fractal type."""
         return 'ifs'
@@ -161,14 +631,28 @@ class IFSFractal(Fractal):
             }
         }
     
-    @abstractmethod
     def get_transforms(self) -> list:
         """Get the transformation functions and their probabilities.
         
+        The default builds the functions from AFFINE and PROBS; subclasses
+        without a coefficient table must override this.
+        
         Returns:
             List of (transform_function, probability) tuples
         """
-        pass
+        if self.AFFINE is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} must define AFFINE or override get_transforms()")
+            
+        def make_transform(a, b, c, d, e, f):
+            def transform(x: float, y: float) -> Tuple[float, float]:
+                return a * x + b * y + e, c * x + d * y + f
+            return transform
+        
+        if self._transforms is None:
+            self._transforms = [(make_transform(*row), p)
+                                for row, p in zip(self.AFFINE.tolist(), self.PROBS.tolist())]
+        return self._transforms
     
     def adaptive_iterations_for_zoom(self, bounds: Tuple[float, float, float, float], 
                                    base_iterations: int) -> int:
@@ -189,15 +673,75 @@ class IFSFractal(Fractal):
         # Calculate zoom level (higher = more zoomed in)
         zoom_level = default_width / current_width
         
-        # Scale iterations based on zoom level
-        # Use square root to avoid excessive iteration counts
-        zoom_factor = max(1.0, zoom_level ** 0.75)
+        # Memoized on the values alone, so every fractal, test and render
+        # asking about the same view shares one entry
+        return _adaptive_ifs_iter(int(base_iterations), zoom_level)
+    
+    def get_affine_transforms(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the transforms as a table of affine coefficients.
+        
+        The AFFINE and PROBS tables are used directly when declared.
+        Otherwise each transform from get_transforms() is probed at three
+        points to recover its coefficients, so any affine callable works.
+        
+        Returns:
+            Tuple of (coeffs, probabilities) where coeffs has shape (K, 6)
+            with rows (a, b, c, d, e, f) for x' = a*x + b*y + e and
+            y' = c*x + d*y + f
+        """
+        if self.AFFINE is not None:
+            coeffs = np.ascontiguousarray(self.AFFINE, dtype=np.float64)
+            probabilities = np.asarray(self.PROBS, dtype=np.float64)
+            return coeffs, probabilities / probabilities.sum()
+            
+        transforms = self.get_transforms()
+        coeffs = np.empty((len(transforms), 6), dtype=np.float64)
+        
+        for k, (transform_func, _) in enumerate(transforms):
+            e, f = transform_func(0.0, 0.0)
+            x1, y1 = transform_func(1.0, 0.0)
+            x2, y2 = transform_func(0.0, 1.0)
+            coeffs[k] = (x1 - e, x2 - e, y1 - f, y2 - f, e, f)
+            
+        probabilities = np.array([p for _, p in transforms], dtype=np.float64)
+        return coeffs, probabilities / probabilities.sum()
+    
+    def next_seed(self) -> int:
+        """Draw the seed for the next chaos-game kernel run.
+        
+        Returns:
+            Seed for numba's per-thread random generator
+        """
+        return int(self._rng.integers(2**32))
+    
+    def warmup(self):
+        """Compile the chaos-game kernel without consuming a seed."""
+        state = self._rng.bit_generator.state
+        super().warmup()
+        self._rng.bit_generator.state = state
+    
+    def get_kernel_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the coefficient table and cumulative probabilities for ifs_kernel.
         
-        # Cap the maximum iterations to prevent excessive computation
-        max_iterations = min(base_iterations * 10, 10000000)
-        adjusted_iterations = int(base_iterations * zoom_factor)
+        Both are computed on first use and reused for every later frame.
         
-        return min(adjusted_iterations, max_iterations)
+        Returns:
+            Tuple of (coeffs, cum_probs) where coeffs has shape
+            (K, IFS_COEFF_STRIDE) with the affine coefficients in the first
+            six columns
+        """
+        if self._affine_tables is None:
+            affine, probabilities = self.get_affine_transforms()
+            
+            # Pad rows to a full cache line and align the table to 64 bytes
+            n_values = len(affine) * IFS_COEFF_STRIDE
+            storage = np.zeros(n_values + IFS_COEFF_STRIDE, dtype=np.float64)
+            offset = (-storage.ctypes.data % 64) // storage.itemsize
+            coeffs = storage[offset:offset + n_values].reshape(len(affine), IFS_COEFF_STRIDE)
+            coeffs[:, :6] = affine
+            
+            self._affine_tables = (coeffs, np.cumsum(probabilities))
+        return self._affine_tables
     
     def compute(self, width: int, height: int, bounds: Tuple[float, float, float, float],
                 **params) -> np.ndarray:
@@ -218,65 +762,24 @@ class IFSFractal(Fractal):
         # Apply adaptive iteration scaling based on zoom level
         if params.get('adaptive_iter', True):
             iterations = self.adaptive_iterations_for_zoom(bounds, iterations)
-        
-        # Initialize result array
-        result = np.zeros((height, width), dtype=np.float32)
-        
-        # Get transforms and probabilities
-        transforms = self.get_transforms()
-        probabilities = np.array([p for _, p in transforms])
-        probabilities = probabilities / probabilities.sum()
-        
-        # Starting point
-        x, y = 0.0, 0.0
+            
+        coeffs, cum_probs = self.get_kernel_tables()
         
         # Skip first iterations to let the point settle
         skip = min(100, iterations // 100)
         
-        for i in range(iterations + skip):
-            # Choose random transform based on probabilities
-            choice = np.random.choice(len(transforms), p=probabilities)
-            transform_func, _ = transforms[choice]
-            
-            # Apply transform
-            x, y = transform_func(x, y)
-            
-            if i < skip:
-                continue
-                
-            # Map to pixel coordinates with sub-pixel accuracy
-            fx = (x - xmin) / (xmax - xmin) * (width - 1)
-            fy = (y - ymin) / (ymax - ymin) * (height - 1)
-            
-            px = int(fx)
-            py = int(fy)
-            
-            # Apply anti-aliasing by distributing the point across nearby pixels
-            if 0 <= px < width-1 and 0 <= py < height-1:
-                # Calculate fractional parts for anti-aliasing
-                dx = fx - px
-                dy = fy - py
-                
-                # Distribute the point weight across 4 neighboring pixels (bilinear)
-                w00 = (1 - dx) * (1 - dy)
-                w10 = dx * (1 - dy) 
-                w01 = (1 - dx) * dy
-                w11 = dx * dy
-                
-                result[height - 1 - py, px] += w00
-                result[height - 1 - py, px + 1] += w10
-                result[height - 1 - (py + 1), px] += w01
-                result[height - 1 - (py + 1), px + 1] += w11
-            elif 0 <= px < width and 0 <= py < height:
-                # Fall back to single pixel for edge cases
-                result[height - 1 - py, px] += 1
-                
-        # Normalize and apply logarithmic scaling for better visualization
-        result = np.where(result > 0, np.log1p(result), 0)
-        if result.max() > 0:
-            result = result / result.max()
-            
-        return result
+        # Bucket writes by tile once the image outgrows the cache
+        image_bytes = width * height * 4
+        bin_by_tile = image_bytes > IFS_TILE_MIN_BYTES
+        
+        # One chain per thread, within the histogram memory budget
+        n_chains = max(1, min(get_num_threads(),
+                              IFS_CHAIN_MAX_BYTES // image_bytes,
+                              iterations // IFS_MIN_CHAIN_ITERATIONS))
+        
+        return ifs_kernel(coeffs, cum_probs, iterations, skip,
+                          xmin, xmax, ymin, ymax, width, height,
+                          self.next_seed(), bin_by_tile, n_chains)
 
 
 class LSystemFractal(Fractal):
@@ -1,12 +1,33 @@
 """Deterministic fractal implementations for consistent behavior."""
 
+import math
+import struct
 import numpy as np
 from numba import jit, prange
 from typing import Tuple, Dict, Any
-from .base import Fractal
+from .base import Fractal, normalize_log_density
 
 
-@jit(nopython=True, parallel=True, cache=True)
+def bounds_seed(bounds: Tuple[float, float, float, float]) -> int:
+    """Derive a stable seed from the bit patterns of the bounds.
+    
+    Mixes the four float64 words with the splitmix64 finalizer, so the seed
+    is cheap to compute and, unlike hash(), identical across processes.
+    
+    Args:
+        bounds: (xmin, xmax, ymin, ymax) coordinate bounds
+        
+    Returns:
+        Non-negative 31-bit seed
+    """
+    h = 0
+    for word in struct.unpack('<4Q', struct.pack('<4d', *bounds)):
+        h = ((h ^ word) * 0xff51afd7ed558ccd) & 0xFFFFFFFFFFFFFFFF
+        h ^= h >> 33
+    return h & 0x7FFFFFFF
+
+
+@jit(nopython=True, nogil=True, parallel=True, cache=True)
 def sierpinski_escape_time(xmin: float, xmax: float, ymin: float, ymax: float,
                           width: int, height: int, max_iter: int) -> np.ndarray:
     """Deterministic Sierpinski Triangle using escape-time algorithm.
@@ -19,39 +40,36 @@ def sierpinski_escape_time(xmin: float, xmax: float, ymin: float, ymax: float,
     dx = (xmax - xmin) / width
     dy = (ymax - ymin) / height
     
+    # Scale to integer coordinates for binary test
+    scale = 2**max_iter
+    
+    # Integer column coordinates are shared by every row, so compute them
+    # once; columns outside the unit square are marked with -1
+    ixs = np.empty(width, dtype=np.int64)
+    for px in range(width):
+        x = xmin + px * dx
+        ixs[px] = int(x * scale) if 0 <= x <= 1 else -1
+        
+    # Every row costs the same, and prange's default schedule already hands
+    # each thread one contiguous block of rows, so no manual striping
     for py in prange(height):
+        # Sierpinski Triangle test: point is in the triangle if
+        # the binary representation of floor coordinates has no
+        # overlapping 1 bits
         y = ymin + py * dy
+        if y < 0 or y > 1:
+            continue
+        iy = int(y * scale)
+        
         for px in range(width):
-            x = xmin + px * dx
-            
-            # Sierpinski Triangle test: point is in the triangle if
-            # the binary representation of floor coordinates has no
-            # overlapping 1 bits
-            if x < 0 or y < 0 or x > 1 or y > 1:
-                result[py, px] = 0
-                continue
-            
-            # Scale to integer coordinates for binary test
-            scale = 2**max_iter
-            ix = int(x * scale)
-            iy = int(y * scale)
+            ix = ixs[px]
             
             # Sierpinski test: point is in fractal if ix & iy == 0
-            # This gives the characteristic triangular holes
-            iterations = 0
-            temp_x, temp_y = ix, iy
-            
-            for i in range(max_iter):
-                if temp_x & temp_y:
-                    iterations = i
-                    break
-                temp_x >>= 1
-                temp_y >>= 1
-            else:
-                iterations = max_iter
-                
-            # Normalize result
-            result[py, px] = iterations / max_iter
+            # This gives the characteristic triangular holes. One AND covers
+            # every bit level at once, since a shared bit at any level shows
+            # up in the full-width words
+            if ix >= 0 and (ix & iy) == 0:
+                result[py, px] = 1.0
                 
     return result
 
@@ -75,17 +93,21 @@ class DeterministicSierpinskiTriangle(Fractal):
             **params: Additional parameters (max_iter)
             
         Returns:
-            2D array representing the fractal
+            Read-only 2D array representing the fractal, shared with later
+            calls for the same view
         """
         max_iter = params.get('max_iter', self.max_iter)
         xmin, xmax, ymin, ymax = bounds
         
-        # Calculate zoom level for adaptive iterations
-        zoom_level = 1.2 / (xmax - xmin)
+        # Calculate zoom level for adaptive iterations; math.log2 skips the
+        # NumPy scalar round trip
         if params.get('adaptive_iter', True):
-            max_iter = min(max_iter + int(np.log2(max(1, zoom_level))), 24)
+            zoom_level = 1.2 / (xmax - xmin)
+            max_iter = min(max_iter + int(math.log2(max(1, zoom_level))), 24)
         
-        return sierpinski_escape_time(xmin, xmax, ymin, ymax, width, height, max_iter)
+        return self.cached_grid(
+            (tuple(bounds), width, height, max_iter),
+            lambda: sierpinski_escape_time(xmin, xmax, ymin, ymax, width, height, max_iter))
     
     def get_default_bounds(self) -> Tuple[float, float, float, float]:
         """Get default viewing bounds."""
@@ -109,16 +131,17 @@ class DeterministicSierpinskiTriangle(Fractal):
         return 'escape_time'
 
 
-@jit(nopython=True, parallel=True, cache=True)
-def sierpinski_chaos_game_deterministic(width: int, height: int, 
-                                       bounds: Tuple[float, float, float, float],
+@jit(nopython=True, nogil=True, parallel=True, cache=True)
+def sierpinski_chaos_game_deterministic(width: int, height: int,
+                                       xmin: float, xmax: float,
+                                       ymin: float, ymax: float,
                                        seed: int = 42) -> np.ndarray:
     """Deterministic chaos game for Sierpinski Triangle with fixed seed.
     
     This version uses a deterministic sequence instead of random numbers,
-    ensuring the fractal looks the same every time.
+    ensuring the fractal looks the same every time. The bounds are passed as
+    scalars, like sierpinski_escape_time, so no tuple is boxed per call.
     """
-    xmin, xmax, ymin, ymax = bounds
     result = np.zeros((height, width), dtype=np.float32)
     
     # Triangle vertices in normalized coordinates
@@ -128,6 +151,10 @@ def sierpinski_chaos_game_deterministic(width: int, height: int,
         [1.0, 0.0]      # Bottom right
     ])
     
+    # Pixels per unit, hoisted out of the loop
+    scale_x = (width - 1) / (xmax - xmin)
+    scale_y = (height - 1) / (ymax - ymin)
+    
     # Starting point
     x, y = 0.5, 0.5
     
@@ -153,17 +180,15 @@ def sierpinski_chaos_game_deterministic(width: int, height: int,
             continue
             
         # Map to pixel coordinates
-        px = int((x - xmin) / (xmax - xmin) * (width - 1))
-        py = int((y - ymin) / (ymax - ymin) * (height - 1))
+        px = int((x - xmin) * scale_x)
+        py = int((y - ymin) * scale_y)
         
         if 0 <= px < width and 0 <= py < height:
             result[height - 1 - py, px] += 1
     
-    # Normalize
-    if result.max() > 0:
-        result = np.log1p(result)
-        result = result / result.max()
-        
+    # Apply logarithmic scaling for better visualization
+    normalize_log_density(result)
+    
     return result
 
 
@@ -178,8 +203,10 @@ class DeterministicSierpinskiChaos(Fractal):
                 **params) -> np.ndarray:
         """Compute Sierpinski using deterministic chaos game."""
         # Use bounds as seed for consistency - same zoom area = same result
-        seed = hash(str(bounds)) % (2**31)
-        return sierpinski_chaos_game_deterministic(width, height, bounds, seed)
+        seed = bounds_seed(bounds)
+        xmin, xmax, ymin, ymax = bounds
+        return sierpinski_chaos_game_deterministic(width, height, xmin, xmax,
+                                                   ymin, ymax, seed)
     
     def get_default_bounds(self) -> Tuple[float, float, float, float]:
         """Get default viewing bounds."""
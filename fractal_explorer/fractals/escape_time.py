@@ -1,131 +1,586 @@
 """Escape-time fractal implementations."""
 
 import numpy as np
-from numba import jit, prange
-from typing import Tuple, Dict, Any, Optional
+from numba import jit, prange, config
+from typing import Tuple, Dict, Any, Optional, Callable
 from .base import EscapeTimeFractal
+from ..utils.cuda import cuda_available
 
 
-@jit(nopython=True, parallel=True, cache=True)
-def mandelbrot_kernel(xmin: float, xmax: float, ymin: float, ymax: float,
-                      width: int, height: int, max_iter: int) -> np.ndarray:
+# Initial iterations between refreshes of the saved orbit point used to detect
+# cycles; the interval doubles after each refresh (Brent's method)
+PERIOD_CHECK_INTERVAL = 8
+
+# Edge length of the square pixel tiles the grid kernels hand out to threads
+GRID_TILE_SIZE = 32
+
+# Starting and smallest rectangle sizes for Mariani-Silver subdivision
+SUBDIVIDE_TILE_SIZE = 64
+SUBDIVIDE_MIN_SIZE = 8
+
+
+@jit(nopython=True, inline='always')
+def in_main_bulbs(cr: float, ci: float) -> bool:
+    """Check whether c lies in the Mandelbrot main cardioid or period-2 bulb.
+    
+    Args:
+        cr, ci: Real and imaginary parts of c
+        
+    Returns:
+        True if the point is known to be in the set
+    """
+    xq = cr - 0.25
+    ci2 = ci * ci
+    q = xq * xq + ci2
+    if q * (q + xq) <= 0.25 * ci2:
+        return True
+    return (cr + 1.0) * (cr + 1.0) + ci2 <= 0.0625
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, boundscheck=False,
+     error_model='numpy', cache=True)
+def mandelbrot_kernel(xs: np.ndarray, ys: np.ndarray,
+                      max_iter: int) -> Tuple[np.ndarray, np.ndarray]:
     """Optimized Mandelbrot set computation kernel.
     
+    The iteration runs in the precision of the coordinate axes, so
+    float32 axes give a fast preview and float64 axes a full render.
+    The smooth-coloring logarithms are left to smooth_escape_counts, which
+    applies them to the whole image in one vectorized pass.
+    
     Args:
-        xmin, xmax, ymin, ymax: Coordinate bounds
-        width, height: Image dimensions
+        xs: Real coordinate of each pixel column
+        ys: Imaginary coordinate of each pixel row
         max_iter: Maximum iterations
         
     Returns:
-        2D array of iteration counts
+        Tuple of (counts, zmag2) 2D arrays holding the integer escape count
+        and the squared magnitude at escape (0 where the point never escaped)
     """
+    height = ys.shape[0]
+    width = xs.shape[0]
     result = np.zeros((height, width), dtype=np.float32)
+    zmag2 = np.zeros((height, width), dtype=np.float32)
     
-    dx = (xmax - xmin) / width
-    dy = (ymax - ymin) / height
+    # Parallelize over square tiles rather than rows, so threads pick up
+    # expensive tiles inside the set alongside cheap ones outside it
+    tiles_x = (width + GRID_TILE_SIZE - 1) // GRID_TILE_SIZE
+    tiles_y = (height + GRID_TILE_SIZE - 1) // GRID_TILE_SIZE
     
-    for py in prange(height):
-        y = ymin + py * dy
-        for px in range(width):
-            x = xmin + px * dx
-            c = complex(x, y)
-            z = 0j
-            
-            for i in range(max_iter):
-                if abs(z) > 2.0:
-                    # Smooth coloring
-                    result[py, px] = i + 1 - np.log2(np.log2(abs(z)))
-                    break
-                z = z * z + c
-            else:
-                result[py, px] = max_iter
+    for tile in prange(tiles_x * tiles_y):
+        y0 = (tile // tiles_x) * GRID_TILE_SIZE
+        x0 = (tile % tiles_x) * GRID_TILE_SIZE
+        for py in range(y0, min(y0 + GRID_TILE_SIZE, height)):
+            ci = ys[py]
+            for px in range(x0, min(x0 + GRID_TILE_SIZE, width)):
+                cr = xs[px]
                 
-    return result
+                # Points in the main cardioid or the period-2 bulb never escape
+                if in_main_bulbs(cr, ci):
+                    result[py, px] = max_iter
+                    continue
+                    
+                # Zero in the precision of the axes
+                zr = cr - cr
+                zi = zr
+                zr_old = zr
+                zi_old = zi
+                period = 0
+                check_len = PERIOD_CHECK_INTERVAL
+                
+                for i in range(max_iter):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 > 4.0:
+                        result[py, px] = i + 1
+                        zmag2[py, px] = zr2 + zi2
+                        break
+                    zi = (zr + zr) * zi + ci
+                    zr = zr2 - zi2 + cr
+                    
+                    # An orbit that revisits a saved point is periodic and stays bounded
+                    if zr == zr_old and zi == zi_old:
+                        result[py, px] = max_iter
+                        break
+                    period += 1
+                    if period == check_len:
+                        period = 0
+                        check_len += check_len
+                        zr_old = zr
+                        zi_old = zi
+                else:
+                    result[py, px] = max_iter
+                    
+    return result, zmag2
 
 
-@jit(nopython=True, parallel=True, cache=True)
-def julia_kernel(xmin: float, xmax: float, ymin: float, ymax: float,
-                 width: int, height: int, max_iter: int,
-                 c_real: float, c_imag: float) -> np.ndarray:
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, boundscheck=False,
+     error_model='numpy', cache=True)
+def julia_kernel(xs: np.ndarray, ys: np.ndarray, max_iter: int,
+                 c_real: float, c_imag: float) -> Tuple[np.ndarray, np.ndarray]:
     """Optimized Julia set computation kernel.
     
     Args:
-        xmin, xmax, ymin, ymax: Coordinate bounds
-        width, height: Image dimensions
+        xs: Real coordinate of each pixel column
+        ys: Imaginary coordinate of each pixel row
         max_iter: Maximum iterations
-        c_real, c_imag: Julia constant components
+        c_real, c_imag: Julia constant components, in the precision of the axes
         
     Returns:
-        2D array of iteration counts
+        Tuple of (counts, zmag2) as for mandelbrot_kernel
     """
+    height = ys.shape[0]
+    width = xs.shape[0]
     result = np.zeros((height, width), dtype=np.float32)
-    c = complex(c_real, c_imag)
+    zmag2 = np.zeros((height, width), dtype=np.float32)
     
-    dx = (xmax - xmin) / width
-    dy = (ymax - ymin) / height
+    # Parallelize over square tiles rather than rows, so threads pick up
+    # expensive tiles inside the set alongside cheap ones outside it
+    tiles_x = (width + GRID_TILE_SIZE - 1) // GRID_TILE_SIZE
+    tiles_y = (height + GRID_TILE_SIZE - 1) // GRID_TILE_SIZE
     
-    for py in prange(height):
-        y = ymin + py * dy
-        for px in range(width):
-            x = xmin + px * dx
-            z = complex(x, y)
-            
-            for i in range(max_iter):
-                if abs(z) > 2.0:
-                    # Smooth coloring
-                    result[py, px] = i + 1 - np.log2(np.log2(abs(z)))
-                    break
-                z = z * z + c
-            else:
-                result[py, px] = max_iter
+    for tile in prange(tiles_x * tiles_y):
+        y0 = (tile // tiles_x) * GRID_TILE_SIZE
+        x0 = (tile % tiles_x) * GRID_TILE_SIZE
+        for py in range(y0, min(y0 + GRID_TILE_SIZE, height)):
+            for px in range(x0, min(x0 + GRID_TILE_SIZE, width)):
+                zr = xs[px]
+                zi = ys[py]
+                zr_old = zr
+                zi_old = zi
+                period = 0
+                check_len = PERIOD_CHECK_INTERVAL
                 
-    return result
+                for i in range(max_iter):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 > 4.0:
+                        result[py, px] = i + 1
+                        zmag2[py, px] = zr2 + zi2
+                        break
+                    zi = (zr + zr) * zi + c_imag
+                    zr = zr2 - zi2 + c_real
+                    
+                    # An orbit that revisits a saved point is periodic and stays bounded
+                    if zr == zr_old and zi == zi_old:
+                        result[py, px] = max_iter
+                        break
+                    period += 1
+                    if period == check_len:
+                        period = 0
+                        check_len += check_len
+                        zr_old = zr
+                        zi_old = zi
+                else:
+                    result[py, px] = max_iter
+                    
+    return result, zmag2
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, boundscheck=False,
+     error_model='numpy', cache=True)
+def julia_kernel_batched(xs: np.ndarray, ys: np.ndarray, max_iter: int,
+                         c_reals: np.ndarray,
+                         c_imags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Julia set kernel evaluating several constants in one pass.
+    
+    All K constants are rendered inside one parallel region, so thumbnail
+    strips and parameter sweeps pay for the thread launch once rather than
+    K times. The per-constant iteration matches julia_kernel exactly.
+    
+    Args:
+        xs: Real coordinate of each pixel column
+        ys: Imaginary coordinate of each pixel row
+        max_iter: Maximum iterations
+        c_reals, c_imags: Julia constant components, in the precision of the axes
+        
+    Returns:
+        Tuple of (counts, zmag2) 3D arrays of shape (K, height, width)
+    """
+    n_constants = c_reals.shape[0]
+    height = ys.shape[0]
+    width = xs.shape[0]
+    result = np.zeros((n_constants, height, width), dtype=np.float32)
+    zmag2 = np.zeros((n_constants, height, width), dtype=np.float32)
+    
+    tiles_x = (width + GRID_TILE_SIZE - 1) // GRID_TILE_SIZE
+    tiles_y = (height + GRID_TILE_SIZE - 1) // GRID_TILE_SIZE
+    
+    for tile in prange(tiles_x * tiles_y):
+        y0 = (tile // tiles_x) * GRID_TILE_SIZE
+        x0 = (tile % tiles_x) * GRID_TILE_SIZE
+        
+        # Constants outermost within a tile, so writes stay in one plane
+        for k in range(n_constants):
+            c_real = c_reals[k]
+            c_imag = c_imags[k]
+            for py in range(y0, min(y0 + GRID_TILE_SIZE, height)):
+                for px in range(x0, min(x0 + GRID_TILE_SIZE, width)):
+                    zr = xs[px]
+                    zi = ys[py]
+                    zr_old = zr
+                    zi_old = zi
+                    period = 0
+                    check_len = PERIOD_CHECK_INTERVAL
+                    
+                    for i in range(max_iter):
+                        zr2 = zr * zr
+                        zi2 = zi * zi
+                        if zr2 + zi2 > 4.0:
+                            result[k, py, px] = i + 1
+                            zmag2[k, py, px] = zr2 + zi2
+                            break
+                        zi = (zr + zr) * zi + c_imag
+                        zr = zr2 - zi2 + c_real
+                        
+                        if zr == zr_old and zi == zi_old:
+                            result[k, py, px] = max_iter
+                            break
+                        period += 1
+                        if period == check_len:
+                            period = 0
+                            check_len += check_len
+                            zr_old = zr
+                            zi_old = zi
+                    else:
+                        result[k, py, px] = max_iter
+                        
+    return result, zmag2
 
 
-@jit(nopython=True, parallel=True, cache=True)
-def burning_ship_kernel(xmin: float, xmax: float, ymin: float, ymax: float,
-                       width: int, height: int, max_iter: int) -> np.ndarray:
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, boundscheck=False,
+     error_model='numpy', cache=True)
+def burning_ship_kernel(xs: np.ndarray, ys: np.ndarray,
+                        max_iter: int) -> Tuple[np.ndarray, np.ndarray]:
     """Optimized Burning Ship fractal computation kernel.
     
     Args:
-        xmin, xmax, ymin, ymax: Coordinate bounds
-        width, height: Image dimensions
+        xs: Real coordinate of each pixel column
+        ys: Imaginary coordinate of each pixel row
         max_iter: Maximum iterations
         
     Returns:
-        2D array of iteration counts
+        Tuple of (counts, zmag2) 2D arrays holding the integer escape count
+        and the squared magnitude at escape (0 where the point never escaped)
     """
+    height = ys.shape[0]
+    width = xs.shape[0]
     result = np.zeros((height, width), dtype=np.float32)
+    zmag2 = np.zeros((height, width), dtype=np.float32)
     
-    dx = (xmax - xmin) / width
-    dy = (ymax - ymin) / height
+    # Parallelize over square tiles rather than rows, so threads pick up
+    # expensive tiles inside the set alongside cheap ones outside it
+    tiles_x = (width + GRID_TILE_SIZE - 1) // GRID_TILE_SIZE
+    tiles_y = (height + GRID_TILE_SIZE - 1) // GRID_TILE_SIZE
     
-    for py in prange(height):
-        y = ymin + py * dy
-        for px in range(width):
-            x = xmin + px * dx
-            zr, zi = 0.0, 0.0
-            cr, ci = x, y
-            
-            for i in range(max_iter):
-                if zr * zr + zi * zi > 4.0:
-                    # Smooth coloring
-                    result[py, px] = i + 1 - np.log2(np.log2(np.sqrt(zr*zr + zi*zi)))
-                    break
+    for tile in prange(tiles_x * tiles_y):
+        y0 = (tile // tiles_x) * GRID_TILE_SIZE
+        x0 = (tile % tiles_x) * GRID_TILE_SIZE
+        for py in range(y0, min(y0 + GRID_TILE_SIZE, height)):
+            ci = ys[py]
+            for px in range(x0, min(x0 + GRID_TILE_SIZE, width)):
+                cr = xs[px]
+                zr = cr - cr
+                zi = zr
+                
+                for i in range(max_iter):
+                    if zr * zr + zi * zi > 4.0:
+                        result[py, px] = i + 1
+                        zmag2[py, px] = zr * zr + zi * zi
+                        break
+                        
+                    # Burning Ship iteration: z = (|Re(z)| + i|Im(z)|)^2 + c
+                    zr_temp = zr * zr - zi * zi + cr
+                    zi = abs((zr + zr) * zi) + ci
+                    zr = abs(zr_temp)
+                else:
+                    result[py, px] = max_iter
                     
-                # Burning Ship iteration: z = (|Re(z)| + i|Im(z)|)^2 + c
-                zr_temp = zr * zr - zi * zi + cr
-                zi = abs(2.0 * zr * zi) + ci
-                zr = abs(zr_temp)
+    return result, zmag2
+
+
+def smooth_escape_counts(counts: np.ndarray, zmag2: np.ndarray) -> np.ndarray:
+    """Apply smooth coloring to the escape counts of a grid kernel.
+    
+    Runs the two logarithms once over the escaped pixels instead of inside
+    every kernel loop, so NumPy can use its vectorized log2.
+    
+    Args:
+        counts: Integer escape counts, updated in place
+        zmag2: Squared magnitude at escape, 0 for points that never escaped
+        
+    Returns:
+        The counts array with fractional smooth iteration counts
+    """
+    escaped = zmag2 > 0
+    # log2(log2(|z|)) written on |z|^2 to skip the square root
+    counts[escaped] -= np.log2(0.5 * np.log2(zmag2[escaped]))
+    return counts
+
+
+def quantize_counts(counts: np.ndarray, max_iter: int) -> np.ndarray:
+    """Quantize smooth iteration counts to 16-bit integers.
+    
+    Maps [0, max_iter] onto the full uint16 range, which keeps far more
+    precision than colorization needs at half the size of float32.
+    
+    Args:
+        counts: Smooth iteration counts
+        max_iter: Maximum iterations used for the counts
+        
+    Returns:
+        uint16 array with the shape of counts
+    """
+    scaled = counts * np.float32(65535.0 / max_iter) + np.float32(0.5)
+    return np.clip(scaled, 0, 65535).astype(np.uint16)
+
+
+def mirror_about_real_axis(compute_rows: Callable[[np.ndarray], np.ndarray],
+                           ys: np.ndarray,
+                           bounds: Tuple[float, float, float, float]) -> np.ndarray:
+    """Compute a grid symmetric about the real axis from one half of it.
+    
+    Fractals where conjugating c conjugates the orbit, like the Mandelbrot
+    set, have the same counts at y and -y. Row i sits at ymin + i * dy, so
+    in a view centred on the real axis row i mirrors row height - i and
+    only the rows up to the axis need iterating; other views are computed
+    in full.
+    
+    Args:
+        compute_rows: Function computing the grid for a subset of the rows
+        ys: Imaginary coordinate of each pixel row
+        bounds: (xmin, xmax, ymin, ymax) coordinate bounds
+        
+    Returns:
+        2D array of iteration counts
+    """
+    _, _, ymin, ymax = bounds
+    height = ys.shape[0]
+    if height < 4 or abs(ymin + ymax) > 1e-12 * (ymax - ymin):
+        return compute_rows(ys)
+        
+    # Rows 0 .. height // 2 reach the axis; row 0 has no partner
+    half = height // 2 + 1
+    lower = compute_rows(ys[:half])
+    grid = np.empty((height,) + lower.shape[1:], dtype=lower.dtype)
+    grid[:half] = lower
+    grid[half:] = lower[height - half:0:-1]
+    return grid
+
+
+def subdivide_escape_time(escape: Callable[[np.ndarray], np.ndarray],
+                          xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Render an escape-time grid with Mariani-Silver subdivision.
+    
+    If every pixel on the border of a rectangle has the same value, the
+    whole rectangle does, so it is filled without iterating its interior.
+    Other rectangles are split into quarters down to SUBDIVIDE_MIN_SIZE and
+    then evaluated in full. The borders of each level are evaluated in a
+    single kernel call.
+    
+    Args:
+        escape: Function mapping a 1D complex array of points to smooth
+            iteration counts
+        xs: Real coordinate of each pixel column
+        ys: Imaginary coordinate of each pixel row
+        
+    Returns:
+        2D array of iteration counts
+    """
+    height, width = ys.shape[0], xs.shape[0]
+    result = np.empty((height, width), dtype=np.float32)
+    done = np.zeros((height, width), dtype=bool)
+    
+    def evaluate(mask):
+        mask &= ~done
+        py, px = np.nonzero(mask)
+        if py.size:
+            result[py, px] = escape(xs[px] + 1j * ys[py])
+            done[py, px] = True
+            
+    size = SUBDIVIDE_TILE_SIZE
+    rects = [(y0, min(y0 + size, height), x0, min(x0 + size, width))
+             for y0 in range(0, height, size) for x0 in range(0, width, size)]
+    
+    while rects:
+        borders = np.zeros((height, width), dtype=bool)
+        for y0, y1, x0, x1 in rects:
+            borders[y0, x0:x1] = borders[y1 - 1, x0:x1] = True
+            borders[y0:y1, x0] = borders[y0:y1, x1 - 1] = True
+        evaluate(borders)
+        
+        interiors = np.zeros((height, width), dtype=bool)
+        next_rects = []
+        for y0, y1, x0, x1 in rects:
+            edge = np.concatenate((result[y0, x0:x1], result[y1 - 1, x0:x1],
+                                   result[y0:y1, x0], result[y0:y1, x1 - 1]))
+            if edge.min() == edge.max():
+                result[y0:y1, x0:x1] = edge[0]
+                done[y0:y1, x0:x1] = True
+            elif y1 - y0 <= SUBDIVIDE_MIN_SIZE or x1 - x0 <= SUBDIVIDE_MIN_SIZE:
+                interiors[y0:y1, x0:x1] = True
             else:
-                result[py, px] = max_iter
+                ym = (y0 + y1) // 2
+                xm = (x0 + x1) // 2
+                next_rects += [(y0, ym, x0, xm), (y0, ym, xm, x1),
+                               (ym, y1, x0, xm), (ym, y1, xm, x1)]
+        evaluate(interiors)
+        rects = next_rects
+        
+    return result
+
+
+def masked_escape_time(z: np.ndarray, c: np.ndarray, max_iter: int,
+                       burning_ship: bool = False) -> np.ndarray:
+    """Vectorized escape-time iteration over a shrinking set of active points.
+    
+    Each step runs as whole-array NumPy operations on the points that have
+    not escaped yet, so the work shrinks as the image resolves. This is the
+    fallback when numba's JIT is disabled, where the prange kernels would
+    run one pixel at a time in the interpreter.
+    
+    Args:
+        z: Complex array of starting values
+        c: Complex array (or scalar) added at each step
+        max_iter: Maximum iterations
+        burning_ship: Whether to fold z into the first quadrant before squaring
+        
+    Returns:
+        Array of smooth iteration counts with the shape of z
+    """
+    result = np.full(z.shape, max_iter, dtype=np.float32)
+    flat = result.reshape(-1)
+    active = np.arange(z.size)
+    # Unlike the JIT kernels this stays on complex arrays: compacting two
+    # complex arrays per step beats compacting separate real/imag ones
+    z = z.ravel().copy()
+    c = np.broadcast_to(c, result.shape).ravel().copy()
+    
+    for i in range(max_iter):
+        mag2 = z.real * z.real + z.imag * z.imag
+        escaped = mag2 > 4.0
+        if escaped.any():
+            # Smooth coloring, then drop the escaped points
+            flat[active[escaped]] = i + 1 - np.log2(np.log2(np.sqrt(mag2[escaped])))
+            remaining = ~escaped
+            z, c, active = z[remaining], c[remaining], active[remaining]
+            if active.size == 0:
+                break
                 
+        if burning_ship:
+            z = np.abs(z.real) + 1j * np.abs(z.imag)
+        z = z * z + c
+        
+    return result
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, boundscheck=False,
+     error_model='numpy', cache=True)
+def mandelbrot_escape_kernel(c: np.ndarray, max_iter: int) -> np.ndarray:
+    """Mandelbrot escape-time calculation for arbitrary points.
+    
+    Args:
+        c: 1D array of complex points
+        max_iter: Maximum iterations
+        
+    Returns:
+        1D array of smooth iteration counts
+    """
+    n = c.shape[0]
+    result = np.empty(n, dtype=np.float32)
+    
+    for k in prange(n):
+        cr, ci = c[k].real, c[k].imag
+        if in_main_bulbs(cr, ci):
+            result[k] = max_iter
+            continue
+        zr, zi = 0.0, 0.0
+        
+        for i in range(max_iter):
+            mag2 = zr * zr + zi * zi
+            if mag2 > 4.0:
+                # Smooth coloring
+                result[k] = i + 1 - np.log2(np.log2(np.sqrt(mag2)))
+                break
+            zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+        else:
+            result[k] = max_iter
+            
+    return result
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, boundscheck=False,
+     error_model='numpy', cache=True)
+def julia_escape_kernel(z: np.ndarray, max_iter: int,
+                        c_real: float, c_imag: float) -> np.ndarray:
+    """Julia escape-time calculation for arbitrary starting points.
+    
+    Args:
+        z: 1D array of complex starting points
+        max_iter: Maximum iterations
+        c_real, c_imag: Julia constant components
+        
+    Returns:
+        1D array of smooth iteration counts
+    """
+    n = z.shape[0]
+    result = np.empty(n, dtype=np.float32)
+    
+    for k in prange(n):
+        zr, zi = z[k].real, z[k].imag
+        
+        for i in range(max_iter):
+            mag2 = zr * zr + zi * zi
+            if mag2 > 4.0:
+                # Smooth coloring
+                result[k] = i + 1 - np.log2(np.log2(np.sqrt(mag2)))
+                break
+            zr, zi = zr * zr - zi * zi + c_real, 2.0 * zr * zi + c_imag
+        else:
+            result[k] = max_iter
+            
+    return result
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, boundscheck=False,
+     error_model='numpy', cache=True)
+def burning_ship_escape_kernel(c: np.ndarray, max_iter: int) -> np.ndarray:
+    """Burning Ship escape-time calculation for arbitrary points.
+    
+    Args:
+        c: 1D array of complex points
+        max_iter: Maximum iterations
+        
+    Returns:
+        1D array of smooth iteration counts
+    """
+    n = c.shape[0]
+    result = np.empty(n, dtype=np.float32)
+    
+    for k in prange(n):
+        cr, ci = c[k].real, c[k].imag
+        zr, zi = 0.0, 0.0
+        
+        for i in range(max_iter):
+            mag2 = zr * zr + zi * zi
+            if mag2 > 4.0:
+                # Smooth coloring
+                result[k] = i + 1 - np.log2(np.log2(np.sqrt(mag2)))
+                break
+            zr_temp = zr * zr - zi * zi + cr
+            zi = abs(2.0 * zr * zi) + ci
+            zr = abs(zr_temp)
+        else:
+            result[k] = max_iter
+            
     return result
 
 
 class MandelbrotSet(EscapeTimeFractal):
     """The Mandelbrot set fractal."""
     
+    ADAPTIVE_ITER = True
+    
     def __init__(self):
         """Initialize Mandelbrot set."""
         super().__init__("Mandelbrot Set", max_iter=256)
@@ -138,28 +593,62 @@ class MandelbrotSet(EscapeTimeFractal):
             width: Width in pixels
             height: Height in pixels
             bounds: (xmin, xmax, ymin, ymax) coordinate bounds
-            **params: Additional parameters (max_iter)
+            **params: Additional parameters (max_iter, preview, use_gpu, subdivide,
+                tile_cache, quantize)
             
         Returns:
-            2D array of iteration counts
+            2D array of iteration counts, or uint16 counts scaled to the
+            full 16-bit range when quantize is set
         """
-        max_iter = params.get('max_iter', self.max_iter)
-        xmin, xmax, ymin, ymax = bounds
+        max_iter = self.resolve_max_iter(bounds, params)
+            
+        use_gpu = params.get('use_gpu', True) and cuda_available()
+        subdivide = params.get('subdivide', False)
+        tile_cache = params.get('tile_cache', False)
+        # Tiles are always computed in double precision, so a tiled preview
+        # is the full render and shares its cache entry
+        preview = params.get('preview', False) and not tile_cache
         
-        # Calculate zoom level for adaptive iterations
-        zoom_level = 4.0 / (xmax - xmin)
-        if params.get('adaptive_iter', True):
-            max_iter = self.adaptive_iterations(zoom_level)
+        def compute_grid():
+            if use_gpu:
+                from ..utils.cuda.escape_time import mandelbrot_cuda
+                return self.compute_cuda(mandelbrot_cuda, width, height, bounds, max_iter)
+            if tile_cache:
+                return self.compute_tiled(
+                    lambda xs, ys: smooth_escape_counts(*mandelbrot_kernel(xs, ys, max_iter)),
+                    width, height, bounds, (max_iter,))
+            xs, ys = self.pixel_axes(width, height, bounds, preview)
+            if config.DISABLE_JIT:
+                c = xs[np.newaxis, :] + 1j * ys[:, np.newaxis]
+                return masked_escape_time(np.zeros_like(c), c, max_iter)
+            if subdivide:
+                return subdivide_escape_time(
+                    lambda c: mandelbrot_escape_kernel(c, max_iter), xs, ys)
+            return mirror_about_real_axis(
+                lambda rows: smooth_escape_counts(*mandelbrot_kernel(xs, rows, max_iter)),
+                ys, bounds)
             
-        return mandelbrot_kernel(xmin, xmax, ymin, ymax, width, height, max_iter)
+        key = (tuple(bounds), width, height, max_iter, preview, use_gpu, subdivide,
+               tile_cache)
+        grid = self.cached_grid(key, compute_grid)
+        return quantize_counts(grid, max_iter) if params.get('quantize', False) else grid
     
     def get_default_bounds(self) -> Tuple[float, float, float, float]:
         """Get default viewing bounds."""
         return (-2.5, 1.0, -1.25, 1.25)
     
     def escape_calculation(self, c: np.ndarray, max_iter: int) -> np.ndarray:
-        """Not used for optimized kernel implementation."""
-        pass
+        """Perform the Mandelbrot escape-time calculation for given points.
+        
+        Args:
+            c: Array of complex numbers
+            max_iter: Maximum iterations
+            
+        Returns:
+            Array of smooth iteration counts with the same shape as c
+        """
+        c = np.ascontiguousarray(c, dtype=np.complex128)
+        return mandelbrot_escape_kernel(c.ravel(), max_iter).reshape(c.shape)
     
     def get_interesting_points(self) -> Dict[str, Tuple[float, float, float]]:
         """Get interesting points to explore.
@@ -199,18 +688,73 @@ class JuliaSet(EscapeTimeFractal):
             width: Width in pixels
             height: Height in pixels
             bounds: (xmin, xmax, ymin, ymax) coordinate bounds
-            **params: Additional parameters (max_iter, c_real, c_imag)
+            **params: Additional parameters (max_iter, c_real, c_imag, preview,
+                use_gpu, subdivide, tile_cache, quantize)
             
         Returns:
-            2D array of iteration counts
+            2D array of iteration counts, or uint16 counts scaled to the
+            full 16-bit range when quantize is set
         """
-        max_iter = params.get('max_iter', self.max_iter)
+        max_iter = self.resolve_max_iter(bounds, params)
         c_real = params.get('c_real', self.c_real)
         c_imag = params.get('c_imag', self.c_imag)
-        xmin, xmax, ymin, ymax = bounds
         
-        return julia_kernel(xmin, xmax, ymin, ymax, width, height, max_iter,
-                           c_real, c_imag)
+        use_gpu = params.get('use_gpu', True) and cuda_available()
+        subdivide = params.get('subdivide', False)
+        tile_cache = params.get('tile_cache', False)
+        # Tiles are always computed in double precision, so a tiled preview
+        # is the full render and shares its cache entry
+        preview = params.get('preview', False) and not tile_cache
+        
+        def compute_grid():
+            if use_gpu:
+                from ..utils.cuda.escape_time import julia_cuda
+                return self.compute_cuda(julia_cuda, width, height, bounds,
+                                         max_iter, c_real, c_imag)
+            if tile_cache:
+                return self.compute_tiled(
+                    lambda xs, ys: smooth_escape_counts(
+                        *julia_kernel(xs, ys, max_iter, c_real, c_imag)),
+                    width, height, bounds, (max_iter, c_real, c_imag))
+            xs, ys = self.pixel_axes(width, height, bounds, preview)
+            if config.DISABLE_JIT:
+                z = xs[np.newaxis, :] + 1j * ys[:, np.newaxis]
+                return masked_escape_time(z, complex(c_real, c_imag), max_iter)
+            if subdivide:
+                return subdivide_escape_time(
+                    lambda z: julia_escape_kernel(z, max_iter, c_real, c_imag), xs, ys)
+            dtype = xs.dtype.type
+            return smooth_escape_counts(
+                *julia_kernel(xs, ys, max_iter, dtype(c_real), dtype(c_imag)))
+            
+        key = (tuple(bounds), width, height, max_iter, preview, use_gpu, subdivide,
+               tile_cache, c_real, c_imag)
+        grid = self.cached_grid(key, compute_grid)
+        return quantize_counts(grid, max_iter) if params.get('quantize', False) else grid
+    
+    def compute_batch(self, width: int, height: int,
+                      bounds: Tuple[float, float, float, float],
+                      constants, max_iter: Optional[int] = None,
+                      preview: bool = False) -> np.ndarray:
+        """Compute the Julia set for several constants at once.
+        
+        Args:
+            width: Width in pixels
+            height: Height in pixels
+            bounds: (xmin, xmax, ymin, ymax) coordinate bounds
+            constants: Sequence of (c_real, c_imag) pairs
+            max_iter: Maximum iterations (defaults to self.max_iter)
+            preview: Whether to use float32 axes when the view allows it
+            
+        Returns:
+            3D array of smooth iteration counts, shape (K, height, width)
+        """
+        max_iter = self.max_iter if max_iter is None else max_iter
+        xs, ys = self.pixel_axes(width, height, bounds, preview)
+        c = np.asarray(constants, dtype=xs.dtype).reshape(-1, 2)
+        return smooth_escape_counts(*julia_kernel_batched(
+            xs, ys, max_iter, np.ascontiguousarray(c[:, 0]),
+            np.ascontiguousarray(c[:, 1])))
     
     def get_default_bounds(self) -> Tuple[float, float, float, float]:
         """Get default viewing bounds."""
@@ -240,8 +784,18 @@ class JuliaSet(EscapeTimeFractal):
         return params
     
     def escape_calculation(self, c: np.ndarray, max_iter: int) -> np.ndarray:
-        """Not used for optimized kernel implementation."""
-        pass
+        """Perform the Julia escape-time calculation for given starting points.
+        
+        Args:
+            c: Array of complex starting points
+            max_iter: Maximum iterations
+            
+        Returns:
+            Array of smooth iteration counts with the same shape as c
+        """
+        z = np.ascontiguousarray(c, dtype=np.complex128)
+        return julia_escape_kernel(z.ravel(), max_iter,
+                                   self.c_real, self.c_imag).reshape(z.shape)
     
     def get_interesting_constants(self) -> Dict[str, Tuple[float, float]]:
         """Get interesting Julia set constants.
@@ -264,6 +818,8 @@ class JuliaSet(EscapeTimeFractal):
 class BurningShip(EscapeTimeFractal):
     """The Burning Ship fractal."""
     
+    ADAPTIVE_ITER = True
+    
     def __init__(self):
         """Initialize Burning Ship fractal."""
         super().__init__("Burning Ship", max_iter=256)
@@ -276,28 +832,61 @@ class BurningShip(EscapeTimeFractal):
             width: Width in pixels
             height: Height in pixels
             bounds: (xmin, xmax, ymin, ymax) coordinate bounds
-            **params: Additional parameters (max_iter)
+            **params: Additional parameters (max_iter, preview, use_gpu, subdivide,
+                tile_cache, quantize)
             
         Returns:
-            2D array of iteration counts
+            2D array of iteration counts, or uint16 counts scaled to the
+            full 16-bit range when quantize is set
         """
-        max_iter = params.get('max_iter', self.max_iter)
-        xmin, xmax, ymin, ymax = bounds
+        max_iter = self.resolve_max_iter(bounds, params)
+            
+        use_gpu = params.get('use_gpu', True) and cuda_available()
+        subdivide = params.get('subdivide', False)
+        tile_cache = params.get('tile_cache', False)
+        # Tiles are always computed in double precision, so a tiled preview
+        # is the full render and shares its cache entry
+        preview = params.get('preview', False) and not tile_cache
         
-        # Calculate zoom level for adaptive iterations
-        zoom_level = 4.0 / (xmax - xmin)
-        if params.get('adaptive_iter', True):
-            max_iter = self.adaptive_iterations(zoom_level)
+        def compute_grid():
+            if use_gpu:
+                from ..utils.cuda.escape_time import burning_ship_cuda
+                return self.compute_cuda(burning_ship_cuda, width, height, bounds, max_iter)
+            if tile_cache:
+                return self.compute_tiled(
+                    lambda xs, ys: smooth_escape_counts(*burning_ship_kernel(xs, ys, max_iter)),
+                    width, height, bounds, (max_iter,))
+            xs, ys = self.pixel_axes(width, height, bounds, preview)
+            if config.DISABLE_JIT:
+                c = xs[np.newaxis, :] + 1j * ys[:, np.newaxis]
+                return masked_escape_time(np.zeros_like(c), c, max_iter,
+                                          burning_ship=True)
+            if subdivide:
+                return subdivide_escape_time(
+                    lambda c: burning_ship_escape_kernel(c, max_iter), xs, ys)
+            return smooth_escape_counts(*burning_ship_kernel(xs, ys, max_iter))
             
-        return burning_ship_kernel(xmin, xmax, ymin, ymax, width, height, max_iter)
+        key = (tuple(bounds), width, height, max_iter, preview, use_gpu, subdivide,
+               tile_cache)
+        grid = self.cached_grid(key, compute_grid)
+        return quantize_counts(grid, max_iter) if params.get('quantize', False) else grid
     
     def get_default_bounds(self) -> Tuple[float, float, float, float]:
         """Get default viewing bounds."""
         return (-2.5, 1.5, -2.0, 1.0)
     
     def escape_calculation(self, c: np.ndarray, max_iter: int) -> np.ndarray:
-        """Not used for optimized kernel implementation."""
-        pass
+        """Perform the Burning Ship escape-time calculation for given points.
+        
+        Args:
+            c: Array of complex numbers
+            max_iter: Maximum iterations
+            
+        Returns:
+            Array of smooth iteration counts with the same shape as c
+        """
+        c = np.ascontiguousarray(c, dtype=np.complex128)
+        return burning_ship_escape_kernel(c.ravel(), max_iter).reshape(c.shape)
     
     def get_interesting_points(self) -> Dict[str, Tuple[float, float, float]]:
         """Get interesting points to explore.
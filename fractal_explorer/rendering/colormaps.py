@@ -1,13 +1,154 @@
 """Color palette management for fractal rendering."""
 
+import math
 import numpy as np
+from numba import jit, prange
 from typing import Tuple, List, Optional
 import colorcet as cc
 
 
+# Which of (chroma, second largest component, zero) lands in R, G and B for
+# each of the six sectors of the color wheel
+_HSV_SECTORS = np.array([[0, 1, 2], [1, 0, 2], [2, 0, 1],
+                         [2, 1, 0], [1, 2, 0], [0, 2, 1]], dtype=np.intp)
+
+
+def _build_lut(hex_list: List[str]) -> np.ndarray:
+    """Parse a list of '#rrggbb' colors into a lookup table.
+    
+    Args:
+        hex_list: Colorcet colormap (list of hex colors)
+        
+    Returns:
+        (N, 3) float32 array of RGB values in [0, 1]
+    """
+    raw = bytes.fromhex(''.join(h[1:] for h in hex_list))
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.float32) / 255.0
+
+
+# Entries in the uint8 palette tables used by ColorMapper.get_colors_u8
+U8_LUT_SIZE = 4096
+
+# Entries in the float tables sampled from the formula palettes. 3072
+# intervals put a sample on every sixth of the hue circle, where the rainbow
+# palette has its kinks, so interpolating it is exact
+SAMPLED_LUT_SIZE = 3073
+
+
+@jit(nopython=True, nogil=True, parallel=True, cache=True)
+def _map_to_u8(values: np.ndarray, offset: float, scale: float,
+               lut: np.ndarray, out: np.ndarray):
+    """Normalize values and look up their uint8 colors in one pass.
+    
+    Args:
+        values: 2D array of fractal values
+        offset, scale: Normalization, t = (value - offset) * scale
+        lut: (N, 3) uint8 palette table sampled over [0, 1]
+        out: (height, width, 3) uint8 output
+    """
+    top = lut.shape[0] - 1
+    for y in prange(values.shape[0]):
+        for x in range(values.shape[1]):
+            t = (values[y, x] - offset) * scale
+            # Written so NaN falls to the first entry
+            if not t > 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            k = int(t * top + 0.5)
+            out[y, x, 0] = lut[k, 0]
+            out[y, x, 1] = lut[k, 1]
+            out[y, x, 2] = lut[k, 2]
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, cache=True)
+def _normalize(values: np.ndarray, offset: float, scale: float, out: np.ndarray):
+    """Write t = (value - offset) * scale, clamped to [0, 1], in one pass.
+    
+    Args:
+        values: 2D array of fractal values
+        offset, scale: Affine normalization, with any inversion folded in
+        out: 2D float32 output
+    """
+    for y in prange(values.shape[0]):
+        for x in range(values.shape[1]):
+            # Rounding in the folded inversion can land just below zero,
+            # where the square-root palettes would produce NaN
+            out[y, x] = min(max((values[y, x] - offset) * scale, 0.0), 1.0)
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, cache=True)
+def _interpolate_lut(values: np.ndarray, lut: np.ndarray, out: np.ndarray):
+    """Linearly interpolate every pixel's color from a palette table.
+    
+    Args:
+        values: 2D array of normalized values [0, 1]
+        lut: (N, 3) float32 palette table sampled over [0, 1]
+        out: (height, width, 3) float32 output
+    """
+    top = lut.shape[0] - 1
+    for y in prange(values.shape[0]):
+        for x in range(values.shape[1]):
+            t = values[y, x]
+            # Written so NaN falls to the first entry
+            if not t > 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            pos = t * top
+            # Position N-1 uses the last interval with fraction 1
+            k = min(int(pos), top - 1)
+            frac = pos - k
+            for ch in range(3):
+                lower = lut[k, ch]
+                out[y, x, ch] = lower + (lut[k + 1, ch] - lower) * frac
+
+
+@jit(nopython=True, inline='always')
+def _unit(x: float) -> float:
+    """Clamp a channel value to [0, 1]."""
+    return min(max(x, 0.0), 1.0)
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, cache=True)
+def _fire_kernel(values: np.ndarray, out: np.ndarray):
+    """Fire palette: black -> red -> yellow -> white."""
+    for y in prange(values.shape[0]):
+        for x in range(values.shape[1]):
+            v = values[y, x] * 3
+            out[y, x, 0] = _unit(v)
+            out[y, x, 1] = _unit(v - 1)
+            out[y, x, 2] = _unit(v - 2)
+
+
+@jit(nopython=True, nogil=True, parallel=True, fastmath=True, cache=True)
+def _ocean_kernel(values: np.ndarray, out: np.ndarray):
+    """Ocean palette: dark blue -> cyan -> white."""
+    for y in prange(values.shape[0]):
+        for x in range(values.shape[1]):
+            v = values[y, x]
+            root = math.sqrt(v)
+            out[y, x, 0] = _unit(v * v)
+            out[y, x, 1] = _unit(v * root)
+            out[y, x, 2] = _unit(root)
+
+
+# Custom palettes computed by a fused kernel that writes all three channels
+# in one pass over the image. The trigonometric palettes are sampled into a
+# table once and interpolated like the colorcet ones
+_PALETTE_KERNELS = {
+    'fire': _fire_kernel,
+    'ocean': _ocean_kernel,
+}
+
+
 class ColorMapper:
     """Manages color mapping for fractal visualization."""
     
+    # Palette tables depend on nothing but the palette, so every mapper
+    # shares them
+    _tables = {}
+    
     # Predefined color palettes
     PALETTES = {
         'classic': {
@@ -69,51 +210,164 @@ class ColorMapper:
         """
         self.palette = palette
         self.invert = invert
-        self._cache = {}
         
-    def get_colors(self, values: np.ndarray, 
-                   normalize: bool = True) -> np.ndarray:
+        # Normalized values are only read by the palette pass, so one float32
+        # plane is reused for every frame of the same size
+        self._norm_buf = None
+        
+    def get_colors(self, values: np.ndarray, normalize: bool = True,
+                   vmin: Optional[float] = None,
+                   vmax: Optional[float] = None,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
         """Map fractal values to RGB colors.
         
         Args:
             values: 2D array of fractal values
             normalize: Whether to normalize values to [0, 1]
+            vmin, vmax: Known value range for normalization, so callers
+                coloring the same data again can skip the reductions
+            out: Optional C-contiguous (height, width, 3) float32 array to
+                write into instead of allocating
             
         Returns:
             3D array of RGB values (height, width, 3)
         """
-        if normalize and values.max() > values.min():
-            # Normalize to [0, 1]
-            values = (values - values.min()) / (values.max() - values.min())
+        offset, scale = self._normalization(values, normalize, vmin, vmax)
         
         if self.invert:
-            values = 1.0 - values
-            
-        # Get the color mapping function
-        if self.palette in self.PALETTES:
-            palette_info = self.PALETTES[self.palette]
+            # 1 - (v - offset) * scale == (v - (offset + 1 / scale)) * -scale
+            offset, scale = offset + 1.0 / scale, -scale
             
-            if palette_info['type'] == 'custom':
-                colors = self._get_custom_palette(self.palette, values)
-            else:  # colorcet
-                colors = self._apply_colorcet(palette_info['cmap'], values)
+        if normalize or self.invert:
+            # Normalization and inversion share one pass over the image
+            if self._norm_buf is None or self._norm_buf.shape != values.shape:
+                self._norm_buf = np.empty(values.shape, dtype=np.float32)
+            _normalize(values, offset, scale, self._norm_buf)
+            values = self._norm_buf
         else:
-            # Default to classic if palette not found
-            colors = self._get_custom_palette('classic', values)
+            # The palettes run in float32 whatever the caller passes
+            values = values.astype(np.float32, copy=False)
             
-        return colors
+        return self._apply_palette(values, out)
+    
+    def get_colors_u8(self, values: np.ndarray, normalize: bool = True,
+                      out: Optional[np.ndarray] = None,
+                      vmin: Optional[float] = None,
+                      vmax: Optional[float] = None) -> np.ndarray:
+        """Map fractal values to 8-bit RGB colors.
+        
+        Normalization, the palette lookup and the conversion to bytes run
+        in a single pass against a sampled uint8 palette table, so no
+        float32 image is materialized.
+        
+        Args:
+            values: 2D array of fractal values
+            normalize: Whether to normalize values to [0, 1]
+            out: Optional C-contiguous (height, width, 3) uint8 array to
+                write into instead of allocating
+            vmin, vmax: Known value range for normalization
+            
+        Returns:
+            C-contiguous 3D uint8 array of RGB values (height, width, 3)
+        """
+        offset, scale = self._normalization(values, normalize, vmin, vmax)
+                
+        if out is None:
+            out = np.empty((*values.shape, 3), dtype=np.uint8)
+        _map_to_u8(values, offset, scale, self._get_u8_lut(), out)
+        return out
+    
+    def _normalization(self, values: np.ndarray, normalize: bool,
+                       vmin: Optional[float],
+                       vmax: Optional[float]) -> Tuple[float, float]:
+        """Get the (offset, scale) that maps values onto [0, 1].
+        
+        Args:
+            values: 2D array of fractal values
+            normalize: Whether to normalize at all
+            vmin, vmax: Known value range, computed from values when None
+            
+        Returns:
+            (offset, scale) with t = (value - offset) * scale
+        """
+        if normalize:
+            if vmin is None:
+                vmin = float(values.min())
+            if vmax is None:
+                vmax = float(values.max())
+            if vmax > vmin:
+                return vmin, 1.0 / (vmax - vmin)
+        return 0.0, 1.0
+    
+    def _get_u8_lut(self) -> np.ndarray:
+        """Get the current palette sampled into a uint8 table.
+        
+        Returns:
+            (U8_LUT_SIZE, 3) uint8 array, reversed when inverting
+        """
+        key = ('u8', self.palette, self.invert)
+        lut = self._tables.get(key)
+        if lut is None:
+            ramp = np.linspace(0.0, 1.0, U8_LUT_SIZE, dtype=np.float32)[np.newaxis, :]
+            colors = np.clip(self._apply_palette(ramp)[0], 0, 1)
+            lut = (colors * 255 + 0.5).astype(np.uint8)
+            if self.invert:
+                lut = lut[::-1].copy()
+            self._tables[key] = lut
+        return lut
+    
+    def _apply_palette(self, values: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply the current palette to normalized values.
+        
+        Args:
+            values: Normalized values [0, 1]
+            out: Optional float32 (height, width, 3) output
+            
+        Returns:
+            3D array of RGB values (height, width, 3)
+        """
+        # Default to classic if palette not found
+        name = self.palette if self.palette in self.PALETTES else 'classic'
+        
+        # Palettes that are cheaper than a table lookup run directly
+        if name in _PALETTE_KERNELS or name == 'monochrome':
+            return self._get_custom_palette(name, values, out)
+            
+        return self._apply_colorcet(self._get_lut(name), values, out)
     
-    def _get_custom_palette(self, name: str, values: np.ndarray) -> np.ndarray:
+    def _get_custom_palette(self, name: str, values: np.ndarray,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
         """Get custom color palette.
         
         Args:
             name: Palette name
             values: Normalized values [0, 1]
+            out: Optional float32 output, used by the kernel and monochrome
+                palettes
             
         Returns:
             RGB color array
         """
         h, w = values.shape
+        
+        kernel = _PALETTE_KERNELS.get(name)
+        if kernel is not None:
+            # The kernels fill and clamp every channel, so no zeroing or
+            # clip pass is needed
+            colors = out if out is not None else np.empty((h, w, 3), dtype=np.float32)
+            kernel(values, colors)
+            return colors
+            
+        if name == 'monochrome':
+            # Grayscale: clip one contiguous plane, then interleave it into
+            # all three channels in a single pass
+            gray = np.clip(values, 0, 1).astype(np.float32, copy=False)
+            if out is not None:
+                out[...] = gray[..., np.newaxis]
+                return out
+            return np.repeat(gray[..., np.newaxis], 3, axis=-1)
+            
         colors = np.zeros((h, w, 3), dtype=np.float32)
         
         if name == 'classic':
@@ -122,18 +376,6 @@ class ColorMapper:
             colors[:, :, 1] = np.sin(values * np.pi * 2) ** 2  # Green
             colors[:, :, 2] = np.cos(values * np.pi / 2) ** 2  # Blue
             
-        elif name == 'fire':
-            # Fire palette: black -> red -> yellow -> white
-            colors[:, :, 0] = np.clip(values * 3, 0, 1)  # Red
-            colors[:, :, 1] = np.clip(values * 3 - 1, 0, 1)  # Green
-            colors[:, :, 2] = np.clip(values * 3 - 2, 0, 1)  # Blue
-            
-        elif name == 'ocean':
-            # Ocean palette: dark blue -> cyan -> white
-            colors[:, :, 0] = values ** 2  # Red
-            colors[:, :, 1] = values ** 1.5  # Green
-            colors[:, :, 2] = np.sqrt(values)  # Blue
-            
         elif name == 'twilight':
             # Twilight: purple -> pink -> orange
             t = values
@@ -146,51 +388,47 @@ class ColorMapper:
             hue = values
             colors = self._hsv_to_rgb(hue, np.ones_like(values), np.ones_like(values))
             
-        elif name == 'monochrome':
-            # Grayscale
-            colors[:, :, 0] = values
-            colors[:, :, 1] = values
-            colors[:, :, 2] = values
-            
         return np.clip(colors, 0, 1)
     
-    def _apply_colorcet(self, cmap: List, values: np.ndarray) -> np.ndarray:
-        """Apply a colorcet colormap.
+    def _get_lut(self, name: str) -> np.ndarray:
+        """Get the RGB lookup table of a palette.
+        
+        Colorcet hex strings are parsed and formula palettes are sampled at
+        SAMPLED_LUT_SIZE points on first use; the table is shared by all
+        mappers.
+        
+        Args:
+            name: Palette name
+            
+        Returns:
+            (N, 3) float32 array of RGB values in [0, 1]
+        """
+        lut = self._tables.get(name)
+        if lut is None:
+            if self.PALETTES[name]['type'] == 'colorcet':
+                lut = _build_lut(self.PALETTES[name]['cmap'])
+            else:
+                ramp = np.linspace(0.0, 1.0, SAMPLED_LUT_SIZE,
+                                   dtype=np.float32)[np.newaxis, :]
+                lut = np.ascontiguousarray(self._get_custom_palette(name, ramp)[0],
+                                           dtype=np.float32)
+            self._tables[name] = lut
+        return lut
+    
+    def _apply_colorcet(self, rgb_array: np.ndarray, values: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply a colormap lookup table.
         
         Args:
-            cmap: Colorcet colormap (list of hex colors)
+            rgb_array: (N, 3) lookup table from _get_lut
             values: Normalized values [0, 1]
+            out: Optional float32 (height, width, 3) output
             
         Returns:
             RGB color array
         """
-        # Convert hex colors to RGB
-        rgb_colors = []
-        for hex_color in cmap:
-            rgb = tuple(int(hex_color[i:i+2], 16) / 255.0 for i in (1, 3, 5))
-            rgb_colors.append(rgb)
-        
-        rgb_array = np.array(rgb_colors)
-        
-        # Interpolate colors based on values
-        h, w = values.shape
-        colors = np.zeros((h, w, 3), dtype=np.float32)
-        
-        # Map values to indices in the colormap
-        indices = values * (len(rgb_array) - 1)
-        lower_idx = np.floor(indices).astype(int)
-        upper_idx = np.ceil(indices).astype(int)
-        fraction = indices - lower_idx
-        
-        # Clip indices
-        lower_idx = np.clip(lower_idx, 0, len(rgb_array) - 1)
-        upper_idx = np.clip(upper_idx, 0, len(rgb_array) - 1)
-        
-        # Interpolate between colors
-        for i in range(3):
-            colors[:, :, i] = (rgb_array[lower_idx, i] * (1 - fraction) +
-                              rgb_array[upper_idx, i] * fraction)
-        
+        colors = out if out is not None else np.empty((*values.shape, 3), dtype=np.float32)
+        _interpolate_lut(values, rgb_array, colors)
         return colors
     
     def _hsv_to_rgb(self, h: np.ndarray, s: np.ndarray, v: np.ndarray) -> np.ndarray:
@@ -205,35 +443,19 @@ class ColorMapper:
             RGB array
         """
         h = h * 6.0
-        i = np.floor(h).astype(int)
-        f = h - i
-        
-        p = v * (1 - s)
-        q = v * (1 - s * f)
-        t = v * (1 - s * (1 - f))
-        
-        i = i % 6
-        
-        rgb = np.zeros((*h.shape, 3), dtype=np.float32)
-        
-        # Each case for the 6 sectors of the color wheel
-        mask = (i == 0)
-        rgb[mask] = np.stack([v[mask], t[mask], p[mask]], axis=-1)
-        
-        mask = (i == 1)
-        rgb[mask] = np.stack([q[mask], v[mask], p[mask]], axis=-1)
-        
-        mask = (i == 2)
-        rgb[mask] = np.stack([p[mask], v[mask], t[mask]], axis=-1)
+        i = np.floor(h).astype(np.intp) % 6
         
-        mask = (i == 3)
-        rgb[mask] = np.stack([p[mask], q[mask], v[mask]], axis=-1)
+        # Chroma, the second largest component and the offset that lifts
+        # the smallest component from zero
+        c = v * s
+        x = c * (1 - np.abs(h % 2 - 1))
+        m = v - c
         
-        mask = (i == 4)
-        rgb[mask] = np.stack([t[mask], p[mask], v[mask]], axis=-1)
-        
-        mask = (i == 5)
-        rgb[mask] = np.stack([v[mask], p[mask], q[mask]], axis=-1)
+        # Route the components to their channels for every pixel's sector
+        # in one gather instead of six masked assignments
+        components = np.stack([c, x, np.zeros_like(c)], axis=-1).astype(np.float32, copy=False)
+        rgb = np.take_along_axis(components, _HSV_SECTORS[i], axis=-1)
+        rgb += m[..., np.newaxis]
         
         return rgb
     
@@ -252,7 +474,22 @@ class ColorMapper:
             new_idx = (current_idx - 1) % len(palettes)
             
         self.palette = palettes[new_idx]
-        self._cache.clear()
+        
+    @classmethod
+    def warmup(cls):
+        """Build every palette's tables and compile the color kernels.
+        
+        The first frame in a palette otherwise compiles its kernel, or loads
+        it from Numba's on-disk cache, on the thread that colors the frame.
+        """
+        # Fractal data is float32 at every level
+        values = np.linspace(0.0, 1.0, 16, dtype=np.float32).reshape(4, 4)
+        mapper = cls()
+        for name in cls.PALETTES:
+            for invert in (False, True):
+                mapper.palette, mapper.invert = name, invert
+                mapper.get_colors_u8(values)
+                mapper.get_colors(values)
 
 
 def get_available_palettes() -> dict:
@@ -287,19 +524,12 @@ def create_smooth_gradient(colors: List[Tuple[float, float, float]],
     
     current_pos = 0
     for i in range(n_colors - 1):
-        start_color = np.array(colors[i])
-        end_color = np.array(colors[i + 1])
-        
         # Add extra step to some segments to handle remainder
         seg_len = segment_length + (1 if i < remainder else 0)
         
-        # Create linear interpolation
-        for j in range(seg_len):
-            t = j / (seg_len - 1) if seg_len > 1 else 0
-            gradient[current_pos] = start_color * (1 - t) + end_color * t
-            current_pos += 1
-            
-            if current_pos >= steps:
-                break
+        # Linear interpolation including both end colors of the segment
+        gradient[current_pos:current_pos + seg_len] = np.linspace(
+            colors[i], colors[i + 1], seg_len)
+        current_pos += seg_len
                 
     return gradient
\ No newline at end of file
@@ -1,16 +1,22 @@
 """2D fractal renderer with progressive rendering support."""
 
 import numpy as np
-from typing import Tuple, Optional, Callable
+from typing import Tuple, Optional, Callable, Iterator
 import time
 from concurrent.futures import ThreadPoolExecutor
-from ..fractals.base import Fractal
+from ..fractals.base import Fractal, EscapeTimeFractal
 from .colormaps import ColorMapper
 
 
 class FractalRenderer2D:
     """2D fractal renderer with progressive rendering and caching."""
     
+    # Number of colored images kept in the render cache
+    RENDER_CACHE_SIZE = 8
+    
+    # Full frames expected within this many seconds skip the coarse previews
+    PROGRESSIVE_BUDGET = 0.05
+    
     def __init__(self, fractal: Fractal, width: int = 800, height: int = 600):
         """Initialize the renderer.
         
@@ -33,77 +39,234 @@ class FractalRenderer2D:
         self.progressive_levels = [8, 4, 2, 1]  # Downsampling factors
         self.current_level = 0
         
-        # Cache for rendered regions
+        # Cache for rendered regions, and the fractal data of the same views
+        # under any colors so a palette change only recolors
         self._cache = {}
+        self._data_cache = {}
+        
+        # Scratch image reused by every incremental pan frame
+        self._rgb_u8 = None
+        
+        # (data, vmin, vmax) of the last colorized array, so recoloring the
+        # same data for a palette change skips both reductions
+        self._value_range = None
         self._cache_hits = 0
         self._cache_misses = 0
         
     def render(self, bounds: Optional[Tuple[float, float, float, float]] = None,
-              progressive: bool = True, **params) -> np.ndarray:
+              progressive: bool = True, out: Optional[np.ndarray] = None,
+              as_uint8: bool = False, **params) -> np.ndarray:
         """Render the fractal.
         
+        A blocking render only returns the final frame, so it computes the
+        full-resolution level directly; use progressive_frames() to display
+        the coarse levels while the fine one is computed.
+        
         Args:
             bounds: (xmin, xmax, ymin, ymax) or None for current bounds
-            progressive: Whether to use progressive rendering
+            progressive: Kept for compatibility; the result is the same frame
+                either way
+            out: Optional C-contiguous (height, width, 3) uint8 or float32
+                array the image is colored into, so callers redrawing every
+                frame can keep one buffer; its dtype decides as_uint8 and the
+                frame is not kept in the render cache
+            as_uint8: Whether to return 8-bit colors instead of floats in [0, 1]
             **params: Additional parameters for fractal computation
             
         Returns:
-            RGB image array (height, width, 3)
+            Read-only RGB image array (height, width, 3), or out when given
+            
+        Raises:
+            ValueError: If out has the wrong shape, dtype or layout
         """
         if bounds is not None:
             self.current_bounds = bounds
             
+        # Snapshot the view so a render on a worker thread is not affected
+        # by the UI panning or resizing meanwhile
+        bounds = self.current_bounds
+        width, height = self.width, self.height
+        
+        if out is not None:
+            if out.shape != (height, width, 3):
+                raise ValueError(f"out has shape {out.shape}, expected {(height, width, 3)}")
+            if out.dtype not in (np.uint8, np.float32):
+                raise ValueError(f"out must be uint8 or float32, not {out.dtype}")
+            if not out.flags['C_CONTIGUOUS'] or not out.flags['WRITEABLE']:
+                raise ValueError("out must be a writable C-contiguous array")
+            as_uint8 = out.dtype == np.uint8
+            
         start_time = time.time()
         
-        if progressive:
-            image = self._progressive_render(self.current_bounds, **params)
+        key = self._cache_key(bounds, width, height, as_uint8, params)
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            self._cache_hits += 1
+            self.current_data, image = cached
+            image = self._cache_store(key, image)
+            if out is not None:
+                np.copyto(out, image)
+                image = out
         else:
-            data = self.fractal.compute(self.width, self.height, 
-                                       self.current_bounds, **params)
+            self._cache_misses += 1
+            data = self._data_cache.get(self._view_key(key))
+            if data is None:
+                data = self.fractal.compute(width, height, bounds, **params)
             self.current_data = data
-            image = self.color_mapper.get_colors(data)
+            image = self.colorize(data, as_uint8, out=out)
+            if out is None:
+                image = self._cache_store(key, image)
+            else:
+                # The caller owns the buffer and will overwrite it, so only
+                # the data is kept for a later recolor of the same view
+                self._cache_put(self._data_cache, self._view_key(key), data)
             
         self.render_time = time.time() - start_time
         return image
     
-    def _progressive_render(self, bounds: Tuple[float, float, float, float],
-                           **params) -> np.ndarray:
-        """Perform progressive rendering from coarse to fine.
+    def compute_raw(self, bounds: Optional[Tuple[float, float, float, float]] = None,
+                    **params) -> np.ndarray:
+        """Compute the fractal data for a view without coloring or caching it.
+        
+        Unlike render(), this neither reads nor fills the renderer's frame
+        caches and leaves the current view alone; fractals that keep their
+        own grid cache may still answer from it.
         
         Args:
-            bounds: Coordinate bounds
-            **params: Additional parameters
+            bounds: (xmin, xmax, ymin, ymax) or None for current bounds
+            **params: Additional parameters for fractal computation
             
         Returns:
-            RGB image array
+            2D array of fractal values, as render() stores in current_data
         """
-        final_image = None
+        if bounds is None:
+            bounds = self.current_bounds
+        return self.fractal.compute(self.width, self.height, bounds, **params)
+        
+    def progressive_frames(self, bounds: Optional[Tuple[float, float, float, float]] = None,
+                           as_uint8: bool = False, finest: int = 1,
+                           **params) -> Iterator[Tuple[int, np.ndarray]]:
+        """Render from coarse to fine, yielding each level as it is done.
         
+        The coarse levels are skipped once the first one shows that the full
+        frame fits in PROGRESSIVE_BUDGET, and a cached frame or one recolored
+        from cached data is yielded alone.
+        The final full-resolution frame is stored in the same cache entry as
+        render().
+        
+        Args:
+            bounds: (xmin, xmax, ymin, ymax) or None for current bounds
+            as_uint8: Whether to produce 8-bit colors
+            finest: Finest level to compute, so interactive previews can stop
+                at a reduced resolution
+            **params: Additional parameters for fractal computation
+            
+        Yields:
+            (level, image) pairs ending with level finest, or 1 for a cached
+            or recolored frame; coarse images are upscaled to full size
+        """
+        if bounds is not None:
+            self.current_bounds = bounds
+        bounds = self.current_bounds
+        width, height = self.width, self.height
+            
+        start_time = time.time()
+        
+        key = self._cache_key(bounds, width, height, as_uint8, params)
+        if key in self._cache or self._view_key(key) in self._data_cache:
+            yield 1, self.render(bounds, as_uint8=as_uint8, **params)
+            return
+        self._cache_misses += 1
+        
+        skip_coarse = False
         for level in self.progressive_levels:
-            # Calculate reduced dimensions
-            w = self.width // level
-            h = self.height // level
+            if level < finest:
+                return
+            if level > finest and skip_coarse:
+                continue
+            level_start = time.time()
             
-            # Compute at reduced resolution
-            data = self.fractal.compute(w, h, bounds, **params)
+            # Compute at reduced resolution; coarse levels are replaced by the
+            # next pass, so they may use reduced precision
+            data = self.fractal.compute(width // level, height // level,
+                                        bounds, **dict(params, preview=level > 1))
             
-            # Upscale to full resolution
-            if level > 1:
-                data = self._upscale(data, self.width, self.height)
+            if level == 1:
+                self.current_data = data
+                image = self._cache_store(key, self.colorize(data, as_uint8))
+                self.render_time = time.time() - start_time
+                yield 1, image
+                return
                 
-            self.current_data = data
+            # A level has 1/level**2 of the full frame's pixels, so when the
+            # finest frame fits the budget the previews before it are not
+            # worth it
+            skip_coarse = ((time.time() - level_start) * (level / finest) ** 2
+                           < self.PROGRESSIVE_BUDGET)
             
-            # Convert to colors
-            final_image = self.color_mapper.get_colors(data)
+            self.current_data = self._upscale(data, width, height)
+            yield level, self.colorize(self.current_data, as_uint8)
+    
+    def _cache_key(self, bounds: Tuple[float, float, float, float], width: int,
+                   height: int, as_uint8: bool, params: dict) -> tuple:
+        """Key of a view in the render cache."""
+        return (tuple(bounds), width, height,
+                self.color_mapper.palette, self.color_mapper.invert, as_uint8,
+                tuple(sorted(params.items())))
+    
+    @staticmethod
+    def _view_key(key: tuple) -> tuple:
+        """Part of a render cache key that determines the fractal data."""
+        return key[:3] + key[6:]
+    
+    def _cache_store(self, key: tuple, image: np.ndarray) -> np.ndarray:
+        """Store a finished frame as the most recent cache entry."""
+        image.setflags(write=False)
+        self._cache_put(self._data_cache, self._view_key(key), self.current_data)
+        if key[3:5] != (self.color_mapper.palette, self.color_mapper.invert):
+            # The palette changed while the frame was colored, so the image
+            # may not match its key
+            return image
+        self._cache_put(self._cache, key, (self.current_data, image))
+        return image
+    
+    def _cache_put(self, cache: dict, key: tuple, value):
+        """Insert value as the most recent entry of an LRU cache dict."""
+        cache.pop(key, None)
+        if len(cache) >= self.RENDER_CACHE_SIZE:
+            del cache[next(iter(cache))]
             
-            # For real-time display, you would yield here
-            # yield final_image
+        # Dicts keep insertion order, so reinserting marks the key as recent
+        cache[key] = value
+    
+    def colorize(self, data: np.ndarray, as_uint8: bool = False,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Map fractal data to an RGB image with the current palette.
+        
+        Args:
+            data: 2D array of fractal values
+            as_uint8: Whether to return 8-bit colors instead of floats in [0, 1]
+            out: Optional C-contiguous buffer for the image, uint8 or float32
+                to match as_uint8
             
-        return final_image
+        Returns:
+            C-contiguous RGB image array (height, width, 3)
+        """
+        if self._value_range is None or self._value_range[0] is not data:
+            self._value_range = (data, float(data.min()), float(data.max()))
+        _, vmin, vmax = self._value_range
+        
+        if as_uint8:
+            return self.color_mapper.get_colors_u8(data, out=out, vmin=vmin, vmax=vmax)
+        return self.color_mapper.get_colors(data, vmin=vmin, vmax=vmax, out=out)
     
     def _upscale(self, data: np.ndarray, target_width: int, 
                  target_height: int) -> np.ndarray:
-        """Upscale data using bilinear interpolation.
+        """Upscale data by nearest-neighbour replication.
+        
+        Progressive levels are integer downsampling factors, so each coarse
+        pixel simply covers a level x level block; sizes that do not divide
+        evenly are handled by the same index mapping.
         
         Args:
             data: Input data array
@@ -113,13 +276,11 @@ class FractalRenderer2D:
         Returns:
             Upscaled array
         """
-        from scipy import ndimage
-        
         h, w = data.shape
-        scale_y = target_height / h
-        scale_x = target_width / w
-        
-        return ndimage.zoom(data, (scale_y, scale_x), order=1)
+        rows = np.arange(target_height) * h // target_height
+        cols = np.arange(target_width) * w // target_width
+        # Two 1-D takes are much cheaper than one 2-D fancy index
+        return data.take(cols, axis=1).take(rows, axis=0)
     
     def zoom(self, center_x: float, center_y: float, zoom_factor: float):
         """Zoom in/out at a specific point.
@@ -184,10 +345,84 @@ class FractalRenderer2D:
             ymin + fy_delta, ymax + fy_delta
         )
     
+    def pan_incremental(self, dx: float, dy: float, as_uint8: bool = False,
+                        **params) -> np.ndarray:
+        """Pan by whole pixels, recomputing only the newly exposed strips.
+        
+        The pixels that stay in view are shifted from the last frame; only
+        the L-shaped border the pan exposes is computed. Fractals whose
+        frames cannot be stitched from parts (IFS densities are normalized
+        per frame) and large jumps fall back to a full render.
+        
+        Args:
+            dx: Horizontal displacement in pixels
+            dy: Vertical displacement in pixels
+            as_uint8: Whether to return 8-bit colors instead of floats in [0, 1]
+            **params: Additional parameters for fractal computation
+            
+        Returns:
+            RGB image array (height, width, 3); 8-bit frames share one
+            buffer that the next incremental pan overwrites
+        """
+        dx, dy = int(round(dx)), int(round(dy))
+        data = self.current_data
+        bounds = self.current_bounds
+        self.pan(dx, dy)
+        
+        if (not isinstance(self.fractal, EscapeTimeFractal) or data is None
+                or data.shape != (self.height, self.width)
+                or abs(dx) >= self.width or abs(dy) >= self.height):
+            return self.render(progressive=False, as_uint8=as_uint8, **params)
+            
+        start_time = time.time()
+        
+        # Strips must use the iteration count of the whole view
+        params = dict(params, adaptive_iter=False,
+                      max_iter=self.fractal.resolve_max_iter(bounds, params))
+        
+        # Row py of the new frame is row py + dy of the old one
+        shifted = np.empty((self.height, self.width), dtype=data.dtype)
+        ys = slice(max(dy, 0), self.height + min(dy, 0))
+        xs = slice(max(dx, 0), self.width + min(dx, 0))
+        shifted[max(-dy, 0):self.height - max(dy, 0),
+                max(-dx, 0):self.width - max(dx, 0)] = data[ys, xs]
+        
+        xmin, xmax, ymin, ymax = self.current_bounds
+        px_w = (xmax - xmin) / self.width
+        px_h = (ymax - ymin) / self.height
+        
+        def fill(x0: int, x1: int, y0: int, y1: int):
+            """Compute the pixel block [y0, y1) x [x0, x1) of the new frame."""
+            if x1 > x0 and y1 > y0:
+                shifted[y0:y1, x0:x1] = self.fractal.compute(
+                    x1 - x0, y1 - y0,
+                    (xmin + x0 * px_w, xmin + x1 * px_w,
+                     ymin + y0 * px_h, ymin + y1 * px_h), **params)
+                
+        # Full-width band of exposed rows, then exposed columns beside it
+        row_lo, row_hi = (self.height - dy, self.height) if dy > 0 else (0, -dy)
+        col_lo, col_hi = (self.width - dx, self.width) if dx > 0 else (0, -dx)
+        fill(0, self.width, row_lo, row_hi)
+        keep_lo, keep_hi = (0, row_lo) if dy > 0 else (row_hi, self.height)
+        fill(col_lo, col_hi, keep_lo, keep_hi)
+        
+        self.current_data = shifted
+        if not as_uint8:
+            image = self.colorize(shifted)
+        else:
+            if self._rgb_u8 is None or self._rgb_u8.shape[:2] != shifted.shape:
+                self._rgb_u8 = np.empty((self.height, self.width, 3), dtype=np.uint8)
+            image = self.colorize(shifted, True, out=self._rgb_u8)
+        self.render_time = time.time() - start_time
+        return image
+    
     def reset_view(self):
-        """Reset to default viewing bounds."""
+        """Reset to default viewing bounds.
+        
+        The caches are kept, so returning to the default view after zooming
+        shows its cached frame.
+        """
         self.current_bounds = self.fractal.get_default_bounds()
-        self._cache.clear()
     
     def get_zoom_level(self) -> float:
         """Calculate current zoom level relative to default view.
@@ -244,16 +479,17 @@ class FractalRenderer2D:
                 old_width, old_height = self.width, self.height
                 self.width *= 2
                 self.height *= 2
-                image = self.render(progressive=False)
+                image = self.render(progressive=False, as_uint8=True)
                 self.width, self.height = old_width, old_height
             else:
-                image = self.render(progressive=False)
+                image = self.render(progressive=False, as_uint8=True)
                 
         # Convert to uint8
-        image_uint8 = (image * 255).astype(np.uint8)
+        if image.dtype != np.uint8:
+            image = (image * 255).astype(np.uint8)
         
         # Save using PIL
-        img = Image.fromarray(image_uint8)
+        img = Image.fromarray(image)
         img.save(filename)
     
     def get_stats(self) -> dict:
@@ -14,6 +14,8 @@ class FractalCanvas(QWidget):
     zoom_changed = pyqtSignal(float)  # Emits new zoom level
     bounds_changed = pyqtSignal(tuple)  # Emits new bounds
     render_requested = pyqtSignal()  # Request new render
+    preview_requested = pyqtSignal()  # Request a quick render mid-interaction
+    pan_requested = pyqtSignal(int, int)  # Pan by whole image pixels
     
     def __init__(self, parent=None):
         """Initialize the fractal canvas."""
@@ -22,6 +24,7 @@ class FractalCanvas(QWidget):
         # Canvas state
         self.image_data = None
         self.qimage = None
+        self._qimage_buffer = None
         
         # Interaction state
         self.mouse_pressed = False
@@ -34,6 +37,18 @@ class FractalCanvas(QWidget):
         # Rendering state
         self.renderer = None
         
+        # Pan deltas accumulated between frames, flushed by a single-shot
+        # timer so a burst of mouse moves becomes one incremental render
+        self._pending_pan = [0.0, 0.0]
+        self._pan_timer = QTimer(self)
+        self._pan_timer.setSingleShot(True)
+        self._pan_timer.timeout.connect(self._flush_pan)
+        
+        # Wheel, key and resize events coalesce into one preview per frame
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self.preview_requested.emit)
+        
         # Setup
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
@@ -54,7 +69,8 @@ class FractalCanvas(QWidget):
         """Set the image data to display.
         
         Args:
-            image_data: RGB image array (height, width, 3)
+            image_data: RGB image array (height, width, 3), either uint8 or
+                floats in [0, 1]
         """
         self.image_data = image_data
         self._update_qimage()
@@ -67,31 +83,40 @@ class FractalCanvas(QWidget):
             
         height, width = self.image_data.shape[:2]
         
-        # Convert to uint8
-        img_uint8 = (self.image_data * 255).astype(np.uint8)
-        
-        # Ensure contiguous array
-        if not img_uint8.flags['C_CONTIGUOUS']:
+        # The renderer hands over contiguous uint8 frames as they are; any
+        # other input is converted once
+        img_uint8 = self.image_data
+        if img_uint8.dtype != np.uint8:
+            img_uint8 = (img_uint8 * 255).astype(np.uint8)
+        elif not img_uint8.flags['C_CONTIGUOUS']:
             img_uint8 = np.ascontiguousarray(img_uint8)
             
-        # Create QImage
+        # Create QImage; it shares the array's memory, so keep it alive.
+        # RGB888 stays: Qt converts it while painting in about 0.1 ms per
+        # megapixel, while repacking into a 4-byte format costs a full copy
+        self._qimage_buffer = img_uint8
         self.qimage = QImage(img_uint8.data, width, height, 
                             width * 3, QImage.Format_RGB888)
         
     def paintEvent(self, event):
         """Paint the canvas."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         # Fill background
         painter.fillRect(self.rect(), Qt.black)
         
         # Draw fractal image
-        if self.qimage:
-            # Scale image to fit widget
+        if self.qimage and self.qimage.size() == self.size():
+            # The renderer follows the widget size, so frames normally
+            # need no resampling
+            painter.drawImage(0, 0, self.qimage)
+        elif self.qimage:
+            # Scale image to fit widget; frames shown mid-drag are replaced
+            # at once, so only settled frames pay for smooth filtering
+            mode = Qt.FastTransformation if self.is_panning else Qt.SmoothTransformation
             scaled_img = self.qimage.scaled(self.size(), 
                                            Qt.KeepAspectRatio,
-                                           Qt.SmoothTransformation)
+                                           mode)
             
             # Center the image
             x = (self.width() - scaled_img.width()) // 2
@@ -146,9 +171,25 @@ class FractalCanvas(QWidget):
                     dx = -delta.x() * (img_width / self.width())
                     dy = -delta.y() * (img_height / self.height())
                     
-                    self.renderer.pan(dx, dy)
+                    self._pending_pan[0] += dx
+                    self._pending_pan[1] += dy
                     self.pan_start = event.pos()
-                    self.render_requested.emit()
+                    if not self._pan_timer.isActive():
+                        self._pan_timer.start(16)
+                    
+    def _schedule_render(self):
+        """Request a render at the end of the current frame interval."""
+        if not self._render_timer.isActive():
+            self._render_timer.start(16)
+            
+    def _flush_pan(self):
+        """Emit the whole pixels of pan accumulated since the last frame."""
+        dx, dy = round(self._pending_pan[0]), round(self._pending_pan[1])
+        if dx or dy:
+            # Keep the sub-pixel remainder for the next frame
+            self._pending_pan[0] -= dx
+            self._pending_pan[1] -= dy
+            self.pan_requested.emit(dx, dy)
                     
     def mouseReleaseEvent(self, event):
         """Handle mouse release events."""
@@ -177,6 +218,8 @@ class FractalCanvas(QWidget):
             if self.is_panning:
                 self.is_panning = False
                 self.setCursor(Qt.ArrowCursor)
+                # Repaint the settled frame with smooth scaling
+                self.update()
                 
     def wheelEvent(self, event: QWheelEvent):
         """Handle mouse wheel events for zooming."""
@@ -197,7 +240,7 @@ class FractalCanvas(QWidget):
             
             # Apply zoom
             self.renderer.zoom(x, y, zoom_factor)
-            self.render_requested.emit()
+            self._schedule_render()
             
     def keyPressEvent(self, event):
         """Handle keyboard events."""
@@ -208,30 +251,30 @@ class FractalCanvas(QWidget):
         
         if event.key() == Qt.Key_Left:
             self.renderer.pan(-step, 0)
-            self.render_requested.emit()
+            self._schedule_render()
         elif event.key() == Qt.Key_Right:
             self.renderer.pan(step, 0)
-            self.render_requested.emit()
+            self._schedule_render()
         elif event.key() == Qt.Key_Up:
             self.renderer.pan(0, -step)
-            self.render_requested.emit()
+            self._schedule_render()
         elif event.key() == Qt.Key_Down:
             self.renderer.pan(0, step)
-            self.render_requested.emit()
+            self._schedule_render()
         elif event.key() == Qt.Key_Plus or event.key() == Qt.Key_Equal:
             self.renderer.zoom(self.width() // 2, self.height() // 2, 1.5)
-            self.render_requested.emit()
+            self._schedule_render()
         elif event.key() == Qt.Key_Minus:
             self.renderer.zoom(self.width() // 2, self.height() // 2, 0.67)
-            self.render_requested.emit()
+            self._schedule_render()
         elif event.key() == Qt.Key_R:
             self.renderer.reset_view()
-            self.render_requested.emit()
+            self._schedule_render()
         elif event.key() == Qt.Key_C:
             # Cycle color palette
             if self.renderer:
                 self.renderer.color_mapper.cycle_palette()
-                self.render_requested.emit()
+                self._schedule_render()
                 
     def resizeEvent(self, event):
         """Handle widget resize."""
@@ -239,6 +282,6 @@ class FractalCanvas(QWidget):
             # Update renderer dimensions
             self.renderer.width = event.size().width()
             self.renderer.height = event.size().height()
-            self.render_requested.emit()
+            self._schedule_render()
             
         super().resizeEvent(event)
\ No newline at end of file
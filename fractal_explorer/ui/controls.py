@@ -3,7 +3,8 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QComboBox, QSlider, QSpinBox, QDoubleSpinBox,
                             QPushButton, QGroupBox, QCheckBox, QLineEdit)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
+from functools import partial
 from typing import Dict, Any
 
 
@@ -16,6 +17,11 @@ class ControlPanel(QWidget):
     render_requested = pyqtSignal()
     save_requested = pyqtSignal(str)  # Save with filename
     
+    # Milliseconds of quiet before queued parameter edits are emitted, and
+    # the emission interval while a slider is being dragged
+    PARAM_DEBOUNCE_MS = 200
+    PARAM_DRAG_MS = 50
+    
     def __init__(self, parent=None):
         """Initialize the control panel."""
         super().__init__(parent)
@@ -24,6 +30,21 @@ class ControlPanel(QWidget):
         self.current_fractal = None
         self.parameter_widgets = {}
         
+        # Fractal name -> (page, parameter widgets); pages are built on first
+        # selection and kept, so switching back only changes the shown page
+        self._param_pages = {}
+        
+        # Render settings kept current by the widgets' change signals, so
+        # reading them does not walk every widget
+        self._settings_cache = {'progressive': True, 'adaptive_iter': True}
+        
+        # Parameter edits are collected and emitted together, so typing or
+        # dragging does not request a render per step
+        self._pending_params = {}
+        self._param_timer = QTimer(self)
+        self._param_timer.setSingleShot(True)
+        self._param_timer.timeout.connect(self._flush_param_changes)
+        
         self._setup_ui()
         
     def _setup_ui(self):
@@ -74,12 +95,21 @@ class ControlPanel(QWidget):
         
         self.progressive_check = QCheckBox("Progressive Rendering")
         self.progressive_check.setChecked(True)
+        self.progressive_check.toggled.connect(
+            lambda checked: self._settings_cache.__setitem__('progressive', checked)
+        )
         render_layout.addWidget(self.progressive_check)
         
         self.adaptive_check = QCheckBox("Adaptive Iterations")
         self.adaptive_check.setChecked(True)
+        self.adaptive_check.toggled.connect(
+            lambda checked: self._settings_cache.__setitem__('adaptive_iter', checked)
+        )
         render_layout.addWidget(self.adaptive_check)
         
+        self.hires_check = QCheckBox("Save at 2x Resolution")
+        render_layout.addWidget(self.hires_check)
+        
         render_group.setLayout(render_layout)
         layout.addWidget(render_group)
         
@@ -87,7 +117,7 @@ class ControlPanel(QWidget):
         button_layout = QVBoxLayout()
         
         self.render_btn = QPushButton("Render")
-        self.render_btn.clicked.connect(self.render_requested.emit)
+        self.render_btn.clicked.connect(self._on_render_clicked)
         button_layout.addWidget(self.render_btn)
         
         self.reset_btn = QPushButton("Reset View")
@@ -118,34 +148,70 @@ class ControlPanel(QWidget):
             fractals: Dictionary of fractal name -> fractal instance
         """
         self.fractals = fractals
+        for page, _ in self._param_pages.values():
+            self.params_layout.removeWidget(page)
+            page.deleteLater()
+        self._param_pages.clear()
         self.fractal_combo.clear()
         self.fractal_combo.addItems(list(fractals.keys()))
         
+    @pyqtSlot(str)
     def _on_fractal_changed(self, name: str):
         """Handle fractal type change."""
         if name in self.fractals:
             self.current_fractal = self.fractals[name]
-            self._update_parameters()
+            self._update_parameters(name)
             self.fractal_changed.emit(name)
             
-    def _update_parameters(self):
-        """Update parameter widgets based on current fractal."""
-        # Clear existing parameter widgets
-        for widget in self.parameter_widgets.values():
-            widget.setParent(None)
-        self.parameter_widgets.clear()
-        
-        # Clear layout
-        while self.params_layout.count():
-            item = self.params_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+    def _update_parameters(self, name: str):
+        """Show the parameter widgets of the current fractal.
+        
+        Args:
+            name: Name the current fractal is listed under
+        """
+        # Edits queued for the previous fractal no longer apply
+        self._param_timer.stop()
+        self._pending_params.clear()
+        
+        # Hidden pages take no space, unlike the pages of a QStackedWidget,
+        # which is as tall as its tallest page once labels wrap
+        for page, _ in self._param_pages.values():
+            page.hide()
+        if name not in self._param_pages:
+            page, widgets = self._build_parameter_page(self.current_fractal)
+            self.params_layout.addWidget(page)
+            self._param_pages[name] = (page, widgets)
+        page, self.parameter_widgets = self._param_pages[name]
+        page.show()
+        
+        # Widgets clamp their defaults to their range and keep the values
+        # set on an earlier visit
+        self._settings_cache = {'progressive': self.progressive_check.isChecked(),
+                                'adaptive_iter': self.adaptive_check.isChecked()}
+        for param_name, widget in self.parameter_widgets.items():
+            if isinstance(widget, (QSpinBox, QDoubleSpinBox, QSlider)):
+                self._settings_cache[param_name] = widget.value()
+            elif isinstance(widget, QComboBox):
+                self._settings_cache[param_name] = widget.currentText()
+            else:
+                self._settings_cache[param_name] = widget.text()
                 
-        if not self.current_fractal:
-            return
+    def _build_parameter_page(self, fractal):
+        """Create the parameter widgets of a fractal on a new page.
+        
+        Args:
+            fractal: Fractal whose parameters the page edits
             
+        Returns:
+            (page, widgets) with widgets mapping parameter name -> widget
+        """
+        page = QWidget()
+        page_layout = QVBoxLayout()
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        widgets = {}
+        
         # Get fractal parameters
-        params = self.current_fractal.get_parameters()
+        params = fractal.get_parameters()
         
         # Create widgets for each parameter
         for param_name, param_info in params.items():
@@ -196,8 +262,10 @@ class ControlPanel(QWidget):
                     value_label.setMinimumWidth(40)
                     value_label.setAlignment(Qt.AlignCenter)
                     widget.valueChanged.connect(
-                        lambda v, l=value_label, p=param_name: self._on_slider_changed(v, l, p)
+                        partial(self._on_slider_changed, label=value_label,
+                                param_name=param_name)
                     )
+                    widget.sliderReleased.connect(self._flush_param_changes)
                     control_layout.addWidget(widget)
                     control_layout.addWidget(value_label)
                 else:
@@ -206,9 +274,7 @@ class ControlPanel(QWidget):
                     widget.setMinimum(param_info.get('min', -999999))
                     widget.setMaximum(param_info.get('max', 999999))
                     widget.setValue(default)
-                    widget.valueChanged.connect(
-                        lambda v, p=param_name: self.parameter_changed.emit(p, v)
-                    )
+                    widget.valueChanged.connect(partial(self._queue_param, param_name))
                     control_layout.addWidget(widget)
                     
             elif param_type == float:
@@ -219,9 +285,7 @@ class ControlPanel(QWidget):
                 widget.setDecimals(4)
                 widget.setValue(default)
                 widget.setMinimumWidth(80)
-                widget.valueChanged.connect(
-                    lambda v, p=param_name: self.parameter_changed.emit(p, v)
-                )
+                widget.valueChanged.connect(partial(self._queue_param, param_name))
                 control_layout.addWidget(widget)
                 
             elif param_type == str:
@@ -230,14 +294,12 @@ class ControlPanel(QWidget):
                     widget.addItems(param_info['options'])
                     widget.setCurrentText(default)
                     widget.currentTextChanged.connect(
-                        lambda v, p=param_name: self.parameter_changed.emit(p, v)
+                        partial(self._on_option_changed, param_name)
                     )
                 else:
                     widget = QLineEdit()
                     widget.setText(default)
-                    widget.textChanged.connect(
-                        lambda v, p=param_name: self.parameter_changed.emit(p, v)
-                    )
+                    widget.textChanged.connect(partial(self._queue_param, param_name))
                 control_layout.addWidget(widget)
                 
             else:
@@ -247,27 +309,71 @@ class ControlPanel(QWidget):
             param_vlayout.addLayout(control_layout)
             param_widget.setLayout(param_vlayout)
             
-            self.parameter_widgets[param_name] = widget
-            self.params_layout.addWidget(param_widget)
+            widgets[param_name] = widget
+            page_layout.addWidget(param_widget)
             
+        page.setLayout(page_layout)
+        return page, widgets
+        
     def _on_slider_changed(self, value: int, label: QLabel, param_name: str):
         """Handle slider value change."""
         label.setText(str(value))
+        slider = self.parameter_widgets.get(param_name)
+        self._queue_param(param_name, value,
+                          dragging=slider is not None and slider.isSliderDown())
+        
+    def _queue_param(self, param_name: str, value, dragging: bool = False):
+        """Queue a parameter edit for the next flush.
+        
+        Args:
+            param_name: Parameter name
+            value: New value, replacing any queued one
+            dragging: Whether a slider is held; drags flush at a fixed rate
+                for live previews instead of waiting for a pause
+        """
+        self._settings_cache[param_name] = value
+        self._pending_params[param_name] = value
+        if not dragging:
+            self._param_timer.start(self.PARAM_DEBOUNCE_MS)
+        elif not self._param_timer.isActive():
+            self._param_timer.start(self.PARAM_DRAG_MS)
+            
+    def _on_option_changed(self, param_name: str, value: str):
+        """Handle an option selection, which is applied immediately."""
+        self._settings_cache[param_name] = value
         self.parameter_changed.emit(param_name, value)
         
+    @pyqtSlot()
+    def _flush_param_changes(self):
+        """Emit every queued parameter edit."""
+        self._param_timer.stop()
+        pending, self._pending_params = self._pending_params, {}
+        for param_name, value in pending.items():
+            self.parameter_changed.emit(param_name, value)
+        
+    @pyqtSlot(str)
     def _on_palette_changed(self, palette: str):
         """Handle color palette change."""
         self.parameter_changed.emit('palette', palette)
         
+    @pyqtSlot(int)
     def _on_invert_changed(self, state: int):
         """Handle color inversion change."""
         self.parameter_changed.emit('invert_colors', state == Qt.Checked)
         
+    @pyqtSlot()
+    def _on_render_clicked(self):
+        """Apply queued parameter edits, then request a render."""
+        self._flush_param_changes()
+        self.render_requested.emit()
+        
+    @pyqtSlot()
     def _on_reset_view(self):
         """Handle reset view button."""
         self.parameter_changed.emit('reset_view', True)
         self.render_requested.emit()
         
+    @pyqtSlot()
     def _on_save_image(self):
         """Handle save image button."""
         from PyQt5.QtWidgets import QFileDialog
@@ -291,22 +397,6 @@ class ControlPanel(QWidget):
         """Get current render settings.
         
         Returns:
-            Dictionary of render settings
+            Dictionary of render settings, a copy the caller may modify
         """
-        settings = {
-            'progressive': self.progressive_check.isChecked(),
-            'adaptive_iter': self.adaptive_check.isChecked(),
-        }
-        
-        # Add current parameter values
-        for param_name, widget in self.parameter_widgets.items():
-            if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                settings[param_name] = widget.value()
-            elif isinstance(widget, QSlider):
-                settings[param_name] = widget.value()
-            elif isinstance(widget, QComboBox):
-                settings[param_name] = widget.currentText()
-            elif isinstance(widget, QLineEdit):
-                settings[param_name] = widget.text()
-                
-        return settings
\ No newline at end of file
+        return self._settings_cache.copy()
\ No newline at end of file
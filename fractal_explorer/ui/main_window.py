@@ -3,43 +3,90 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
                             QMenuBar, QMenu, QAction, QStatusBar, QMessageBox,
                             QSplitter)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QTimer
 from PyQt5.QtGui import QKeySequence
 import numpy as np
 import time
 
 from .canvas import FractalCanvas
 from .controls import ControlPanel
-from ..rendering import FractalRenderer2D
+from ..rendering import FractalRenderer2D, ColorMapper
 from ..fractals import (MandelbrotSet, JuliaSet, BurningShip,
                         SierpinskiTriangle, BarnsleyFern, DragonCurve)
 from ..fractals.deterministic_fractals import DeterministicSierpinskiTriangle
 
 
 class RenderThread(QThread):
-    """Background thread for fractal rendering."""
+    """Background thread for fractal rendering.
     
-    finished = pyqtSignal(np.ndarray)
-    progress = pyqtSignal(int)
+    The fractal kernels release the GIL, so the UI keeps handling input
+    while a frame is computed. Frames are emitted as they complete and
+    the remaining ones are dropped once interruption is requested.
+    """
     
-    def __init__(self, renderer, bounds, params):
+    frame_ready = pyqtSignal(int, np.ndarray)  # Progressive level, image
+    failed = pyqtSignal(str)
+    
+    def __init__(self, renderer, bounds, params, progressive=True, finest=1):
         super().__init__()
         self.renderer = renderer
         self.bounds = bounds
         self.params = params
+        self.progressive = progressive or finest > 1
+        self.finest = finest
         
     def run(self):
         """Run the rendering process."""
         try:
-            image = self.renderer.render(self.bounds, **self.params)
-            self.finished.emit(image)
+            if self.progressive:
+                frames = self.renderer.progressive_frames(self.bounds, as_uint8=True,
+                                                          finest=self.finest,
+                                                          **self.params)
+            else:
+                frames = iter([(1, self.renderer.render(self.bounds, progressive=False,
+                                                        as_uint8=True, **self.params))])
+            for level, image in frames:
+                if self.isInterruptionRequested():
+                    return
+                self.frame_ready.emit(level, image)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class WarmupThread(QThread):
+    """Background thread that compiles fractal and color kernels ahead of use."""
+    
+    def __init__(self, fractals):
+        super().__init__()
+        self.fractals = list(fractals)
+        
+    def run(self):
+        """Warm a fresh instance of each fractal so no UI state is touched."""
+        for fractal in self.fractals:
+            try:
+                type(fractal)().warmup()
+            except Exception as e:
+                print(f"Warmup error for {fractal.name}: {e}")
+        try:
+            ColorMapper.warmup()
         except Exception as e:
-            print(f"Render error: {e}")
+            print(f"Warmup error for color palettes: {e}")
 
 
 class FractalExplorerWindow(QMainWindow):
     """Main application window."""
     
+    # Progressive level rendered while the user is zooming or resizing, and
+    # the quiet time in milliseconds before the full-resolution render
+    PREVIEW_LEVEL = 2
+    SETTLE_MS = 200
+    
+    # Renderers of recently shown fractals kept with their frame caches
+    RENDERER_CACHE_SIZE = 3
+    
+    # Marks a parameter that has not been changed since the fractal was shown
+    _NO_VALUE = object()
+    
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -61,9 +108,32 @@ class FractalExplorerWindow(QMainWindow):
         # Current state
         self.current_fractal = None
         self.renderer = None
+        self._renderers = {}  # Fractal name -> renderer, most recent last
         self.render_thread = None
+        self.warmup_thread = None
         self.render_params = {}
         
+        # One render runs at a time; requests made meanwhile collapse into a
+        # single follow-up render with the latest settings
+        self._render_pending = False
+        self._pending_preview = False
+        self._render_start = 0.0
+        
+        # Inputs of the running render and of the full-resolution frame on
+        # the canvas, so a render that would repeat that frame is skipped
+        self._render_key = None
+        self._shown_key = None
+        
+        # Palette and invert edits in the same event slice share one recolor,
+        # and parameter edits one render
+        self._redraw_pending = False
+        self._render_dirty = False
+        
+        # Previews are followed by a full render once interaction pauses
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.timeout.connect(self._render_fractal)
+        
         # Setup UI
         self._setup_ui()
         self._setup_menu()
@@ -82,10 +152,26 @@ class FractalExplorerWindow(QMainWindow):
         # Use a timer to defer the render until after the window is fully shown
         QTimer.singleShot(100, self._initial_render)
         
+    def closeEvent(self, event):
+        """Let running threads finish before the window is torn down."""
+        if self.render_thread is not None:
+            self.render_thread.requestInterruption()
+            self.render_thread.wait()
+        if self.warmup_thread is not None:
+            self.warmup_thread.wait()
+        super().closeEvent(event)
+        
+    @pyqtSlot()
     def _initial_render(self):
         """Perform the initial fractal render."""
         if self.renderer:
             self._render_fractal()
+            
+        # Compile the remaining fractals' kernels while the user looks around
+        if self.warmup_thread is None:
+            others = [f for f in self.fractals.values() if f is not self.current_fractal]
+            self.warmup_thread = WarmupThread(others)
+            self.warmup_thread.start()
         
     def _setup_ui(self):
         """Setup the user interface."""
@@ -104,12 +190,14 @@ class FractalExplorerWindow(QMainWindow):
         self.control_panel = ControlPanel()
         self.control_panel.fractal_changed.connect(self._on_fractal_changed)
         self.control_panel.parameter_changed.connect(self._on_parameter_changed)
-        self.control_panel.render_requested.connect(self._render_fractal)
+        self.control_panel.render_requested.connect(self._request_render)
         self.control_panel.save_requested.connect(self._save_image)
         
         # Canvas
         self.canvas = FractalCanvas()
         self.canvas.render_requested.connect(self._render_fractal)
+        self.canvas.preview_requested.connect(self._preview_fractal)
+        self.canvas.pan_requested.connect(self._pan_fractal)
         
         # Add to splitter
         splitter.addWidget(self.control_panel)
@@ -176,6 +264,7 @@ class FractalExplorerWindow(QMainWindow):
         
         self.statusbar.showMessage("Ready")
         
+    @pyqtSlot(str)
     def _on_fractal_changed(self, name: str):
         """Handle fractal type change."""
         if not name or name not in self.fractals:
@@ -185,8 +274,8 @@ class FractalExplorerWindow(QMainWindow):
             # During initialization, just set up the fractal and renderer without rendering
             self.current_fractal = self.fractals[name]
             if hasattr(self, 'canvas') and self.canvas:
-                self.renderer = FractalRenderer2D(
-                    self.current_fractal,
+                self.renderer = self._get_renderer(
+                    name,
                     max(400, self.canvas.width()),  # Use minimum size during init
                     max(300, self.canvas.height())
                 )
@@ -197,13 +286,10 @@ class FractalExplorerWindow(QMainWindow):
         # Normal operation
         self.current_fractal = self.fractals[name]
         
-        # Create new renderer
+        # Switch renderer
         if hasattr(self, 'canvas') and self.canvas:
-            self.renderer = FractalRenderer2D(
-                self.current_fractal,
-                self.canvas.width(),
-                self.canvas.height()
-            )
+            self.renderer = self._get_renderer(name, self.canvas.width(),
+                                               self.canvas.height())
             
             # Set renderer in canvas
             self.canvas.set_renderer(self.renderer)
@@ -214,73 +300,262 @@ class FractalExplorerWindow(QMainWindow):
             # Render
             self._render_fractal()
             
+    def _get_renderer(self, name: str, width: int, height: int) -> FractalRenderer2D:
+        """Get the renderer of a fractal, reset to its default view.
+        
+        The renderers of the last RENDERER_CACHE_SIZE fractals are kept, so
+        switching back to one reuses the frames it has cached.
+        """
+        renderer = self._renderers.pop(name, None)
+        if renderer is None:
+            renderer = FractalRenderer2D(self.fractals[name], width, height)
+            if len(self._renderers) >= self.RENDERER_CACHE_SIZE:
+                del self._renderers[next(iter(self._renderers))]
+        else:
+            renderer.width, renderer.height = width, height
+            renderer.current_bounds = renderer.fractal.get_default_bounds()
+        self._renderers[name] = renderer
+            
+        # Colors follow the control panel rather than the fractal's last visit
+        renderer.color_mapper.palette = self.control_panel.palette_combo.currentText()
+        renderer.color_mapper.invert = self.control_panel.invert_check.isChecked()
+        return renderer
+        
+    @pyqtSlot(str, object)
     def _on_parameter_changed(self, name: str, value):
-        """Handle parameter change."""
+        """Handle parameter change.
+        
+        Values equal to the current state are ignored, so a value that is
+        emitted again does not redraw or render.
+        """
         if name == 'palette':
-            if self.renderer:
+            if self.renderer and self.renderer.color_mapper.palette != value:
                 self.renderer.color_mapper.palette = value
-                self._update_display()
+                self._request_update_display()
         elif name == 'invert_colors':
-            if self.renderer:
+            if self.renderer and self.renderer.color_mapper.invert != value:
                 self.renderer.color_mapper.invert = value
-                self._update_display()
+                self._request_update_display()
         elif name == 'reset_view':
             self._reset_view()
-        else:
+        elif self.render_params.get(name, self._NO_VALUE) != value:
             self.render_params[name] = value
             # Auto-render for small changes
             if name in ['c_real', 'c_imag']:
-                self._render_fractal()
+                self._request_render()
                 
-    def _render_fractal(self):
-        """Render the current fractal."""
+    @pyqtSlot()
+    def _request_render(self):
+        """Render once the current event has been handled.
+        
+        Edits emitted together, such as both Julia constants or a view reset
+        followed by a render request, then share one render.
+        """
+        if self._render_dirty:
+            return
+        if QThread.currentThread().loopLevel() == 0:
+            # No event loop would run the deferred call
+            self._render_fractal()
+            return
+        self._render_dirty = True
+        QTimer.singleShot(0, self._render_if_dirty)
+        
+    @pyqtSlot()
+    def _render_if_dirty(self):
+        """Run a render requested with _request_render() unless one ran since."""
+        if self._render_dirty:
+            self._render_dirty = False
+            self._render_fractal()
+            
+    @pyqtSlot()
+    def _render_fractal(self, preview: bool = False):
+        """Render the current fractal on the render thread.
+        
+        Args:
+            preview: Stop at PREVIEW_LEVEL and render at full resolution
+                once no further preview is requested for SETTLE_MS
+        """
         if not self.renderer or getattr(self, '_initializing', False):
             return
             
+        if preview:
+            self._settle_timer.start(self.SETTLE_MS)
+        else:
+            self._settle_timer.stop()
+            self._render_dirty = False
+            
+        if self.render_thread is not None:
+            # Drop the running render's remaining levels and start over with
+            # the newest settings once it has stopped; any full request
+            # among the queued ones wins
+            self._pending_preview = preview and (self._pending_preview
+                                                 or not self._render_pending)
+            self._render_pending = True
+            self.render_thread.requestInterruption()
+            return
+            
+        # Get render settings
+        settings = self._get_render_settings()
+        
+        # Extract settings that are explicit parameters to avoid keyword conflicts
+        progressive = settings.pop('progressive', True)
+        bounds = settings.pop('bounds', None)
+        
+        self._render_key = self._frame_key(bounds, settings)
+        if self._render_key == self._shown_key:
+            return
+            
         # Update status
         self.statusbar.showMessage("Rendering...")
         self.control_panel.update_status("Rendering...")
         
-        # Get render settings
-        settings = self.control_panel.get_render_settings()
-        settings.update(self.render_params)
-        
-        # Start render
-        start_time = time.time()
-        
-        try:
-            # Extract settings that are explicit parameters to avoid keyword conflicts
-            progressive = settings.pop('progressive', True)
-            bounds = settings.pop('bounds', None)
+        self._render_start = time.time()
+        self.render_thread = RenderThread(self.renderer, bounds, settings, progressive,
+                                          finest=self.PREVIEW_LEVEL if preview else 1)
+        self.render_thread.frame_ready.connect(self._on_render_frame)
+        self.render_thread.failed.connect(self._render_failed)
+        
+        if QThread.currentThread().loopLevel() == 0:
+            # Without a running event loop no queued frame would be delivered,
+            # so render in place
+            self.render_thread.run()
+            self._on_render_finished()
+        else:
+            # finished is emitted on the render thread; queue it so the
+            # thread is released from the GUI thread's event loop, which
+            # also runs the frames queued before it
+            self.render_thread.finished.connect(self._on_render_finished,
+                                                Qt.QueuedConnection)
+            self.render_thread.start()
             
-            # Render fractal
-            image = self.renderer.render(bounds=bounds, progressive=progressive, **settings)
+    def _frame_key(self, bounds, settings: dict) -> tuple:
+        """Everything that determines the full-resolution frame of a render."""
+        mapper = self.renderer.color_mapper
+        return (self.renderer, tuple(bounds or self.renderer.current_bounds),
+                self.renderer.width, self.renderer.height,
+                mapper.palette, mapper.invert, tuple(sorted(settings.items())))
+        
+    @pyqtSlot()
+    def _preview_fractal(self):
+        """Render a reduced-resolution preview during an interaction."""
+        self._render_fractal(preview=True)
+        
+    @pyqtSlot(int, np.ndarray)
+    def _on_render_frame(self, level: int, image: np.ndarray):
+        """Display a frame from the render thread unless it is stale."""
+        if self._is_stale(self.sender()):
+            return
             
-            # Update canvas
-            self.canvas.set_image(image)
+        thread = self.render_thread
+            
+        self.canvas.set_image(image)
+        self._shown_key = self._render_key if level == 1 else None
+        if level <= thread.finest:
+            self._show_render_stats(time.time() - self._render_start)
+            
+    def _is_stale(self, thread) -> bool:
+        """Whether a result from thread has been superseded.
+        
+        Each render gets its own thread, so the thread identifies the
+        request; anything but the current, uninterrupted thread for the
+        current renderer is outdated.
+        """
+        return (thread is None or thread is not self.render_thread
+                or thread.isInterruptionRequested()
+                or thread.renderer is not self.renderer)
+        
+    @pyqtSlot()
+    def _on_render_finished(self):
+        """Release the render thread and run any render requested meanwhile."""
+        # finished is emitted just before the thread exits; let it exit so
+        # dropping the last reference cannot destroy a running thread
+        self.render_thread.wait()
+        self.render_thread = None
+        if self._render_pending:
+            self._render_pending = False
+            self._render_fractal(self._pending_preview)
+            
+    @pyqtSlot(str)
+    def _render_failed(self, error):
+        """Report a failed render."""
+        if self._is_stale(self.sender()):
+            return
+            
+        QMessageBox.critical(self, "Render Error", f"Failed to render fractal: {str(error)}")
+        self.statusbar.showMessage("Render failed")
+        self.control_panel.update_status("Error: " + str(error))
             
-            # Update status
-            render_time = time.time() - start_time
-            stats = self.renderer.get_stats()
+    @pyqtSlot(int, int)
+    def _pan_fractal(self, dx: int, dy: int):
+        """Pan the current fractal, recomputing only the exposed strips."""
+        if not self.renderer or getattr(self, '_initializing', False):
+            return
             
-            status_msg = (f"Rendered in {render_time:.2f}s | "
-                         f"Zoom: {stats['zoom_level']:.1f}x | "
-                         f"Center: ({stats['center'][0]:.6f}, {stats['center'][1]:.6f})")
+        if self.render_thread is not None or self._settle_timer.isActive():
+            # The frame is being replaced or is only a preview; move the
+            # view and let the follow-up render draw it
+            self.renderer.pan(dx, dy)
+            self._render_fractal(preview=True)
+            return
             
-            self.statusbar.showMessage(status_msg)
-            self.control_panel.update_status(f"Render time: {render_time:.2f}s")
+        settings = self._get_render_settings()
+        settings.pop('progressive', None)
+        settings.pop('bounds', None)
+        start_time = time.time()
+        
+        try:
+            image = self.renderer.pan_incremental(dx, dy, as_uint8=True, **settings)
+            self.canvas.set_image(image)
+            self._shown_key = None
+            self._show_render_stats(time.time() - start_time)
             
         except Exception as e:
-            QMessageBox.critical(self, "Render Error", f"Failed to render fractal: {str(e)}")
             self.statusbar.showMessage("Render failed")
             self.control_panel.update_status("Error: " + str(e))
             
-    def _update_display(self):
+    def _get_render_settings(self) -> dict:
+        """Get the control panel settings merged with changed parameters."""
+        settings = self.control_panel.get_render_settings()
+        # The widgets are current even while their edits are still queued
+        for name, value in self.render_params.items():
+            settings.setdefault(name, value)
+        return settings
+        
+    def _show_render_stats(self, render_time: float):
+        """Show the render time and view position in the status displays."""
+        stats = self.renderer.get_stats()
+        
+        status_msg = (f"Rendered in {render_time:.2f}s | "
+                     f"Zoom: {stats['zoom_level']:.1f}x | "
+                     f"Center: ({stats['center'][0]:.6f}, {stats['center'][1]:.6f})")
+        
+        self.statusbar.showMessage(status_msg)
+        self.control_panel.update_status(f"Render time: {render_time:.2f}s")
+        
+    def _request_update_display(self):
+        """Recolor the display once the current event has been handled."""
+        if self._redraw_pending:
+            return
+        if QThread.currentThread().loopLevel() == 0:
+            # No event loop would run the deferred call
+            self._do_update_display()
+            return
+        self._redraw_pending = True
+        QTimer.singleShot(0, self._do_update_display)
+        
+    @pyqtSlot()
+    def _do_update_display(self):
         """Update display without re-rendering fractal data."""
-        if self.renderer and self.renderer.current_data is not None:
-            image = self.renderer.color_mapper.get_colors(self.renderer.current_data)
+        self._redraw_pending = False
+        if self.render_thread is not None:
+            # Recolor through the follow-up render rather than racing it
+            self._render_fractal()
+        elif self.renderer and self.renderer.current_data is not None:
+            image = self.renderer.colorize(self.renderer.current_data, as_uint8=True)
             self.canvas.set_image(image)
+            self._shown_key = None
             
+    @pyqtSlot(str)
     def _save_image(self, filename: str = None):
         """Save the current fractal image."""
         if not self.renderer:
@@ -294,13 +569,11 @@ class FractalExplorerWindow(QMainWindow):
                 
         if filename:
             try:
-                # Ask for high resolution option
-                reply = QMessageBox.question(self, "Save Options",
-                                           "Save at high resolution (2x)?",
-                                           QMessageBox.Yes | QMessageBox.No,
-                                           QMessageBox.No)
-                
-                high_res = (reply == QMessageBox.Yes)
+                # The resolution is chosen in the control panel, so saving
+                # needs no further prompt
+                high_res = self.control_panel.hires_check.isChecked()
+                if self.render_thread is not None:
+                    self.render_thread.wait()
                 self.renderer.save_image(filename, high_res=high_res)
                 
                 self.statusbar.showMessage(f"Image saved to {filename}")
@@ -308,12 +581,14 @@ class FractalExplorerWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save image: {str(e)}")
                 
+    @pyqtSlot()
     def _reset_view(self):
         """Reset to default view."""
         if self.renderer:
             self.renderer.reset_view()
-            self._render_fractal()
+            self._request_render()
             
+    @pyqtSlot()
     def _zoom_in(self):
         """Zoom in at center."""
         if self.renderer:
@@ -322,6 +597,7 @@ class FractalExplorerWindow(QMainWindow):
             self.renderer.zoom(cx, cy, 1.5)
             self._render_fractal()
             
+    @pyqtSlot()
     def _zoom_out(self):
         """Zoom out at center."""
         if self.renderer:
@@ -330,6 +606,7 @@ class FractalExplorerWindow(QMainWindow):
             self.renderer.zoom(cx, cy, 0.67)
             self._render_fractal()
             
+    @pyqtSlot()
     def _show_about(self):
         """Show about dialog."""
         QMessageBox.about(self, "About Fractal Explorer",
@@ -345,6 +622,7 @@ class FractalExplorerWindow(QMainWindow):
                          "<li>High-resolution export</li>"
                          "</ul>")
                          
+    @pyqtSlot()
     def _show_shortcuts(self):
         """Show keyboard shortcuts dialog."""
         QMessageBox.information(self, "Keyboard Shortcuts",
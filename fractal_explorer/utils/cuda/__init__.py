@@ -0,0 +1,20 @@
+"""CUDA kernels for GPU-accelerated fractal computation."""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def cuda_available() -> bool:
+    """Check whether a CUDA device can be used.
+    
+    Returns:
+        True if Numba can reach a CUDA-capable GPU
+    """
+    try:
+        from numba import cuda
+        return cuda.is_available()
+    except Exception:
+        return False
+
+
+__all__ = ["cuda_available"]
\ No newline at end of file
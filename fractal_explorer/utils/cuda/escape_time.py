@@ -0,0 +1,146 @@
+"""CUDA escape-time kernels."""
+
+import math
+import numpy as np
+from numba import cuda
+from typing import Optional
+
+# Threads per block along each axis
+BLOCK_SIZE = 16
+
+
+@cuda.jit
+def mandelbrot_cuda(out, xmin, dx, ymin, dy, max_iter):
+    """Mandelbrot set kernel, one thread per pixel.
+    
+    Args:
+        out: (height, width) float32 device array of iteration counts
+        xmin, dx: Real coordinate of the first column and column spacing
+        ymin, dy: Imaginary coordinate of the first row and row spacing
+        max_iter: Maximum iterations
+    """
+    px, py = cuda.grid(2)
+    height, width = out.shape
+    if px >= width or py >= height:
+        return
+    
+    cr = xmin + px * dx
+    ci = ymin + py * dy
+    
+    # Points in the main cardioid or the period-2 bulb never escape
+    xq = cr - 0.25
+    q = xq * xq + ci * ci
+    if q * (q + xq) <= 0.25 * ci * ci or (cr + 1.0) * (cr + 1.0) + ci * ci <= 0.0625:
+        out[py, px] = max_iter
+        return
+    
+    zr = 0.0
+    zi = 0.0
+    
+    for i in range(max_iter):
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:
+            # Smooth coloring
+            out[py, px] = i + 1 - math.log2(math.log2(math.sqrt(zr2 + zi2)))
+            return
+        zi = 2.0 * zr * zi + ci
+        zr = zr2 - zi2 + cr
+    
+    out[py, px] = max_iter
+
+
+@cuda.jit
+def julia_cuda(out, xmin, dx, ymin, dy, max_iter, c_real, c_imag):
+    """Julia set kernel, one thread per pixel.
+    
+    Args:
+        out: (height, width) float32 device array of iteration counts
+        xmin, dx: Real coordinate of the first column and column spacing
+        ymin, dy: Imaginary coordinate of the first row and row spacing
+        max_iter: Maximum iterations
+        c_real, c_imag: Julia constant components
+    """
+    px, py = cuda.grid(2)
+    height, width = out.shape
+    if px >= width or py >= height:
+        return
+    
+    zr = xmin + px * dx
+    zi = ymin + py * dy
+    
+    for i in range(max_iter):
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:
+            # Smooth coloring
+            out[py, px] = i + 1 - math.log2(math.log2(math.sqrt(zr2 + zi2)))
+            return
+        zi = 2.0 * zr * zi + c_imag
+        zr = zr2 - zi2 + c_real
+    
+    out[py, px] = max_iter
+
+
+@cuda.jit
+def burning_ship_cuda(out, xmin, dx, ymin, dy, max_iter):
+    """Burning Ship kernel, one thread per pixel.
+    
+    Args:
+        out: (height, width) float32 device array of iteration counts
+        xmin, dx: Real coordinate of the first column and column spacing
+        ymin, dy: Imaginary coordinate of the first row and row spacing
+        max_iter: Maximum iterations
+    """
+    px, py = cuda.grid(2)
+    height, width = out.shape
+    if px >= width or py >= height:
+        return
+    
+    cr = xmin + px * dx
+    ci = ymin + py * dy
+    zr = 0.0
+    zi = 0.0
+    
+    for i in range(max_iter):
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:
+            # Smooth coloring
+            out[py, px] = i + 1 - math.log2(math.log2(math.sqrt(zr2 + zi2)))
+            return
+        # Burning Ship iteration: z = (|Re(z)| + i|Im(z)|)^2 + c
+        zi = abs(2.0 * zr * zi) + ci
+        zr = abs(zr2 - zi2 + cr)
+    
+    out[py, px] = max_iter
+
+
+def launch_2d(kernel, out, *args):
+    """Launch a per-pixel kernel over a 2D device array.
+    
+    Args:
+        kernel: CUDA kernel taking the output array first
+        out: (height, width) device array
+        *args: Remaining kernel arguments
+    """
+    height, width = out.shape
+    blocks = ((width + BLOCK_SIZE - 1) // BLOCK_SIZE,
+              (height + BLOCK_SIZE - 1) // BLOCK_SIZE)
+    kernel[blocks, (BLOCK_SIZE, BLOCK_SIZE)](out, *args)
+
+
+def device_buffer(buffer: Optional[object], width: int, height: int):
+    """Reuse a device output buffer when its shape still matches.
+    
+    Args:
+        buffer: Previously allocated device array or None
+        width: Width in pixels
+        height: Height in pixels
+    
+    Returns:
+        (height, width) float32 device array
+    """
+    if buffer is None or buffer.shape != (height, width):
+        buffer = cuda.device_array((height, width), dtype=np.float32)
+    return buffer
\ No newline at end of file
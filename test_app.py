@@ -105,13 +105,38 @@ def test_color_palettes():
         
         # Test color mapping
         mapper = ColorMapper(palette='fire')
-        test_data = np.random.rand(50, 50)
+        # A fixed ramp over [0, 1] reaches both ends of every palette and
+        # gives the same colors on every run
+        test_data = np.linspace(0, 1, 2500, dtype=np.float32).reshape(50, 50)
         colors = mapper.get_colors(test_data)
         
         assert colors.shape == (50, 50, 3)
         assert colors.min() >= 0
         assert colors.max() <= 1
         
+        # Fire runs from black at the low end to white at the high end
+        assert np.array_equal(colors[0, 0], [0, 0, 0])
+        assert np.array_equal(colors[-1, -1], [1, 1, 1])
+        
+        # The 8-bit path must agree with the float path up to rounding
+        colors_u8 = mapper.get_colors_u8(test_data)
+        assert colors_u8.dtype == np.uint8
+        assert np.abs(colors_u8.astype(int) - np.round(colors * 255)).max() <= 2
+        
+        # A known value range skips the reductions without changing colors
+        vmin, vmax = test_data.min(), test_data.max()
+        assert np.array_equal(mapper.get_colors(test_data, vmin=vmin, vmax=vmax), colors)
+        assert np.array_equal(mapper.get_colors_u8(test_data, vmin=vmin, vmax=vmax), colors_u8)
+        
+        # Inverted square-root palettes must not produce NaN, and a caller
+        # buffer receives the same colors as a fresh array
+        inverted = ColorMapper(palette='ocean', invert=True)
+        expected = inverted.get_colors(test_data)
+        assert not np.isnan(expected).any()
+        buffer = np.empty((50, 50, 3), dtype=np.float32)
+        assert inverted.get_colors(test_data, out=buffer) is buffer
+        assert np.array_equal(buffer, expected)
+        
         print(f"✓ Color mapping works correctly")
         
         return True
@@ -121,6 +146,220 @@ def test_color_palettes():
         return False
 
 
+def test_warmup():
+    """Test that kernel warmup leaves fractal state untouched."""
+    print("\nTesting kernel warmup...")
+    
+    try:
+        from fractal_explorer.fractals import BarnsleyFern, MandelbrotSet
+        
+        # Warmup must not consume a seed from a seeded IFS generator
+        fern = BarnsleyFern()
+        state = fern._rng.bit_generator.state
+        fern.warmup()
+        assert fern._rng.bit_generator.state == state
+        
+        # Warmup frames must not linger in the grid cache
+        mandelbrot = MandelbrotSet()
+        mandelbrot.warmup()
+        assert not mandelbrot._cache
+        
+        # Palette warmup fills the tables every mapper shares
+        from fractal_explorer.rendering import ColorMapper
+        ColorMapper._tables.clear()
+        ColorMapper.warmup()
+        lut = ColorMapper._tables[('u8', 'fire', True)]
+        assert ColorMapper('fire', invert=True)._get_u8_lut() is lut
+        
+        print("✓ Warmup compiles kernels without side effects")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Warmup error: {e}")
+        return False
+
+
+def test_incremental_pan():
+    """Test that an incremental pan matches a full render of the new view."""
+    print("\nTesting incremental pan...")
+    
+    try:
+        from fractal_explorer.fractals import MandelbrotSet
+        from fractal_explorer.rendering import FractalRenderer2D
+        import numpy as np
+        
+        renderer = FractalRenderer2D(MandelbrotSet(), width=160, height=120)
+        renderer.render(progressive=False, use_gpu=False)
+        renderer.pan_incremental(9, -4, use_gpu=False)
+        
+        reference = FractalRenderer2D(MandelbrotSet(), width=160, height=120)
+        reference.pan(9, -4)
+        reference.render(progressive=False, use_gpu=False)
+        
+        assert renderer.current_bounds == reference.current_bounds
+        
+        # Only boundary pixels may flip because of coordinate rounding
+        mismatch = np.mean(np.abs(renderer.current_data - reference.current_data) > 1e-3)
+        assert mismatch < 0.01
+        
+        print(f"✓ Incremental pan: {mismatch * 100:.2f}% pixels differ from a full render")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Incremental pan error: {e}")
+        return False
+
+
+def test_progressive_frames():
+    """Test that progressive frames end with the same frame as render()."""
+    print("\nTesting progressive frames...")
+    
+    try:
+        from fractal_explorer.fractals import MandelbrotSet
+        from fractal_explorer.rendering import FractalRenderer2D
+        import numpy as np
+        
+        renderer = FractalRenderer2D(MandelbrotSet(), width=160, height=120)
+        
+        # A zero budget keeps every coarse level
+        renderer.PROGRESSIVE_BUDGET = 0.0
+        frames = list(renderer.progressive_frames(as_uint8=True, max_iter=100))
+        assert [level for level, _ in frames] == renderer.progressive_levels
+        assert all(image.shape == (120, 160, 3) for _, image in frames)
+        
+        reference = FractalRenderer2D(MandelbrotSet(), width=160, height=120)
+        image = reference.render(progressive=True, as_uint8=True, max_iter=100)
+        assert np.array_equal(frames[-1][1], image)
+        
+        # The final frame is cached, so a repeat yields it alone
+        repeat = list(renderer.progressive_frames(as_uint8=True, max_iter=100))
+        assert len(repeat) == 1 and repeat[0][1] is frames[-1][1]
+        
+        print(f"✓ Progressive frames: levels {[level for level, _ in frames]}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Progressive frames error: {e}")
+        return False
+
+
+def test_palette_recolor():
+    """Test that a palette change recolors cached data instead of recomputing."""
+    print("\nTesting palette recolor...")
+    
+    try:
+        from fractal_explorer.fractals import MandelbrotSet
+        from fractal_explorer.rendering import FractalRenderer2D
+        import numpy as np
+        
+        fractal = MandelbrotSet()
+        renderer = FractalRenderer2D(fractal, width=160, height=120)
+        renderer.render(as_uint8=True, max_iter=100)
+        data = renderer.current_data
+        
+        computed = []
+        compute = fractal.compute
+        fractal.compute = lambda *args, **kwargs: computed.append(1) or compute(*args, **kwargs)
+        
+        renderer.color_mapper.palette = 'fire'
+        image = renderer.render(as_uint8=True, max_iter=100)
+        frames = list(renderer.progressive_frames(as_uint8=False, max_iter=100))
+        assert not computed, "palette change recomputed the fractal"
+        assert renderer.current_data is data
+        assert len(frames) == 1 and frames[0][0] == 1
+        
+        reference = FractalRenderer2D(MandelbrotSet(), width=160, height=120)
+        reference.color_mapper.palette = 'fire'
+        assert np.array_equal(image, reference.render(as_uint8=True, max_iter=100))
+        
+        # Other parameters still compute a new frame
+        renderer.render(as_uint8=True, max_iter=120)
+        assert computed
+        
+        print("✓ Palette change recolored cached data")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Palette recolor error: {e}")
+        return False
+
+
+def test_view_cache():
+    """Test that returning to a rendered view reuses its cached frame."""
+    print("\nTesting view cache...")
+    
+    try:
+        from fractal_explorer.fractals import MandelbrotSet
+        from fractal_explorer.rendering import FractalRenderer2D
+        
+        renderer = FractalRenderer2D(MandelbrotSet(), width=160, height=120)
+        first = renderer.render(as_uint8=True, max_iter=100)
+        renderer.zoom(40, 30, 2.0)
+        renderer.render(as_uint8=True, max_iter=100)
+        
+        renderer.reset_view()
+        image = renderer.render(as_uint8=True, max_iter=100)
+        stats = renderer.get_stats()
+        assert image is first, "reset view was recomputed"
+        assert (stats['cache_hits'], stats['cache_misses']) == (1, 2)
+        
+        print("✓ Reset view served from the render cache")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ View cache error: {e}")
+        return False
+
+
+def test_render_into_buffer():
+    """Test that rendering into a caller's buffer matches a plain render."""
+    print("\nTesting render into buffer...")
+    
+    try:
+        from fractal_explorer.fractals import JuliaSet
+        from fractal_explorer.rendering import FractalRenderer2D
+        import numpy as np
+        
+        renderer = FractalRenderer2D(JuliaSet(), width=64, height=64)
+        reference = FractalRenderer2D(JuliaSet(), width=64, height=64)
+        
+        for dtype, as_uint8 in ((np.uint8, True), (np.float32, False)):
+            buffer = np.empty((64, 64, 3), dtype=dtype)
+            image = renderer.render(out=buffer, max_iter=50)
+            expected = reference.render(as_uint8=as_uint8, max_iter=50)
+            assert image is buffer, "render did not return the buffer"
+            assert np.array_equal(buffer, expected), f"{dtype.__name__} buffer differs"
+            
+            # The buffered frame was not kept, so a plain render recolors the
+            # cached data; that frame is then cached and copied in unchanged
+            misses = renderer.get_stats()['cache_misses']
+            buffer[:] = 0
+            renderer.render(as_uint8=as_uint8, max_iter=50)
+            assert renderer.get_stats()['cache_misses'] == misses + 1
+            renderer.render(out=buffer, max_iter=50)
+            assert np.array_equal(buffer, expected), f"cached {dtype.__name__} frame differs"
+        
+        try:
+            renderer.render(out=np.empty((64, 64, 3), dtype=np.float64), max_iter=50)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("float64 buffer was accepted")
+        
+        print("✓ uint8 and float32 buffers match render(as_uint8=...)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Render into buffer error: {e}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 50)
@@ -131,7 +370,13 @@ def main():
         test_imports,
         test_fractal_computation,
         test_renderer,
-        test_color_palettes
+        test_color_palettes,
+        test_warmup,
+        test_incremental_pan,
+        test_progressive_frames,
+        test_palette_recolor,
+        test_view_cache,
+        test_render_into_buffer
     ]
     
     results = []
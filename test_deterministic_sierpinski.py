@@ -3,11 +3,22 @@
 
 import sys
 import os
+import hashlib
 import numpy as np
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.abspath('.'))
 
+def data_digest(data):
+    """Digest of a fractal data array, for comparing renders exactly."""
+    return hashlib.blake2b(np.ascontiguousarray(data).tobytes()).digest()
+
+
+def data_coverage(data):
+    """Percentage of pixels where the fractal data is nonzero."""
+    return np.count_nonzero(data) / data.size * 100
+
+
 def test_consistency():
     """Test that deterministic version gives consistent results."""
     print("=" * 60)
@@ -45,22 +56,28 @@ def test_consistency():
         print("\nTesting DETERMINISTIC Sierpinski Triangle:")
         renderer2 = FractalRenderer2D(deterministic_sierpinski, 300, 300)
         
-        # Render same area twice  
+        # Render once, then recompute the raw data; a second render would
+        # only be served from the renderer's and the fractal's caches
         image2a = renderer2.render(bounds=test_bounds, progressive=False)
-        image2b = renderer2.render(bounds=test_bounds, progressive=False)
+        deterministic_sierpinski.clear_cache()
+        same = data_digest(renderer2.current_data) == data_digest(
+            renderer2.compute_raw(test_bounds))
+        print(f"  Render vs recomputed data identical: {same}")
         
-        # Compare the two renders
-        difference2 = np.mean(np.abs(image2a - image2b))
-        print(f"  Render 1 vs Render 2 difference: {difference2:.6f}")
-        
-        if difference2 < 0.0001:
+        if same:
             print("  ✓ Deterministic version is consistent (same every time)")
         else:
             print("  ✗ Deterministic version has unexpected differences")
         
-        # Test visual quality
-        coverage_random = np.count_nonzero(image1a) / image1a.size * 100
-        coverage_deterministic = np.count_nonzero(image2a) / image2a.size * 100
+        # Repeated views come from the fractal's grid cache
+        raw = renderer2.compute_raw(test_bounds)
+        assert renderer2.compute_raw(test_bounds) is raw
+        assert not raw.flags.writeable
+        print("  ✓ Repeated view reused from the grid cache")
+        
+        # Test visual quality on the fractal data, one value per pixel
+        coverage_random = data_coverage(renderer1.current_data)
+        coverage_deterministic = data_coverage(renderer2.current_data)
         
         print(f"\nVisual Quality Comparison:")
         print(f"  Random Sierpinski coverage: {coverage_random:.1f}%")
@@ -99,19 +116,18 @@ def test_zoom_behavior():
         print("Testing zoom consistency...")
         
         for name, bounds, expected_zoom in zoom_tests:
-            # Render twice to test consistency
+            # Render once and check that recomputing gives the same data
             image1 = renderer.render(bounds=bounds, progressive=False)
-            image2 = renderer.render(bounds=bounds, progressive=False)
-            
-            # Check consistency
-            difference = np.mean(np.abs(image1 - image2))
-            coverage = np.count_nonzero(image1) / image1.size * 100
+            sierpinski.clear_cache()
+            same = data_digest(renderer.current_data) == data_digest(
+                renderer.compute_raw(bounds))
+            coverage = data_coverage(renderer.current_data)
             
             print(f"\n{name} (zoom ~{expected_zoom:.1f}x):")
-            print(f"  Consistency difference: {difference:.8f}")
+            print(f"  Recomputed data identical: {same}")
             print(f"  Coverage: {coverage:.1f}%")
             
-            if difference < 0.0001:
+            if same:
                 print(f"  ✓ Consistent rendering")
             else:
                 print(f"  ✗ Inconsistent rendering")
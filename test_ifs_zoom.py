@@ -34,16 +34,16 @@ def test_adaptive_iterations():
         print(f"Base iterations: {base_iterations:,}")
         print()
         
-        for name, bounds in test_scenarios:
+        # Zoom level of every scenario relative to the default view, for display
+        default_bounds = sierpinski.get_default_bounds()
+        scenario_bounds = np.array([bounds for _, bounds in test_scenarios])
+        default_width = default_bounds[1] - default_bounds[0]
+        zoom_levels = default_width / (scenario_bounds[:, 1] - scenario_bounds[:, 0])
+        
+        for (name, bounds), zoom_level in zip(test_scenarios, zoom_levels):
             # Test adaptive iterations
             adaptive_iter = sierpinski.adaptive_iterations_for_zoom(bounds, base_iterations)
             
-            # Calculate zoom level for display
-            default_bounds = sierpinski.get_default_bounds()
-            default_width = default_bounds[1] - default_bounds[0]
-            current_width = bounds[1] - bounds[0]
-            zoom_level = default_width / current_width
-            
             print(f"{name}:")
             print(f"  Bounds: {bounds}")
             print(f"  Zoom level: {zoom_level:.1f}x")
@@ -230,6 +230,10 @@ def main():
     
     results = []
     
+    from fractal_explorer.fractals import SierpinskiTriangle, BarnsleyFern, DragonCurve
+    from testing_utils import warmup_kernels
+    warmup_kernels((SierpinskiTriangle, BarnsleyFern, DragonCurve))
+    
     # Run tests
     results.append(("Adaptive Iterations", test_adaptive_iterations()))
     results.append(("Zoom Quality Comparison", test_zoom_quality_comparison()))
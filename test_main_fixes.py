@@ -141,6 +141,10 @@ def main():
     
     results = []
     
+    from fractal_explorer.fractals import MandelbrotSet, JuliaSet
+    from testing_utils import warmup_kernels
+    warmup_kernels((MandelbrotSet, JuliaSet))
+    
     # Run tests
     results.append(("Basic Functionality", test_basic_functionality()))
     results.append(("GUI Components", test_gui_components()))
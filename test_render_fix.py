@@ -3,6 +3,7 @@
 
 import sys
 import os
+import time
 
 # Set up paths and environment
 sys.path.insert(0, os.path.abspath('.'))
@@ -45,8 +46,20 @@ def test_render_fix():
         # This tests the actual method that was causing the error
         window._initializing = False  # Make sure we're not in init mode
         
+        # Only the keyword plumbing is under test and the render above
+        # already ran the fractal, so stand in a blank frame; autospec keeps
+        # the real signature, which is what raised the error
+        from unittest import mock
+        import numpy as np
+        renderer = window.renderer
+        frame = np.zeros((renderer.height, renderer.width, 3), dtype=np.uint8)
+        
         try:
-            window._render_fractal()
+            with mock.patch.object(renderer, 'progressive_frames', autospec=True,
+                                   return_value=iter([(1, frame)])) as frames:
+                window._render_fractal()
+            assert frames.called, "render thread did not ask for frames"
+            assert 'progressive' not in frames.call_args.kwargs
             print("   ✓ _render_fractal method successful")
         except Exception as e:
             print(f"   ✗ _render_fractal failed: {e}")
@@ -62,12 +75,171 @@ def test_render_fix():
         return False
 
 
+def test_render_thread_coalescing():
+    """Test that renders requested during a threaded render collapse into one."""
+    
+    print("Testing threaded render coalescing...")
+    
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtCore import QTimer, QEvent
+        
+        app = QApplication.instance() or QApplication([])
+        
+        from fractal_explorer.ui.main_window import FractalExplorerWindow
+        
+        window = FractalExplorerWindow()
+        window._initializing = False
+        
+        finished = []
+        on_finished = window._on_render_finished
+        window._on_render_finished = lambda: (finished.append(time.time()), on_finished())
+        
+        state = {}
+        
+        def wait_for_idle():
+            if window.render_thread is None and not window._render_pending:
+                app.quit()
+                
+        poll = QTimer()
+        poll.timeout.connect(wait_for_idle)
+        
+        def request_burst():
+            # Inside the event loop renders run on the render thread
+            window._render_fractal()
+            state['threaded'] = window.render_thread is not None
+            window._render_fractal()
+            window._render_fractal()
+            state['pending'] = window._render_pending
+            poll.start(20)
+            
+        # Give up on a hung render rather than blocking the suite
+        guard = QTimer()
+        guard.setSingleShot(True)
+        guard.timeout.connect(app.quit)
+        guard.start(120000)
+        
+        QTimer.singleShot(0, request_burst)
+        app.exec_()
+        
+        # Release the slots, which would otherwise keep the application
+        # alive into the next test; PyQt frees them with deleteLater
+        guard.timeout.disconnect()
+        poll.timeout.disconnect()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+        
+        # Drop the wrapper so the window is freed with this scope
+        del window._on_render_finished
+        window.close()
+        
+        assert state.get('threaded'), "render did not start a thread"
+        assert state.get('pending'), "later requests were not queued"
+        assert len(finished) == 2, f"expected 2 renders, got {len(finished)}"
+        assert window.canvas.image_data is not None
+        print(f"   ✓ 3 requests rendered as {len(finished)} threaded renders")
+        return True
+        
+    except Exception as e:
+        print(f"   ✗ Threaded render test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_render_thread_passes():
+    """Test that the render thread emits coarse to fine passes until interrupted."""
+    
+    print("Testing render thread passes...")
+    
+    try:
+        from PyQt5.QtCore import Qt
+        from fractal_explorer.ui.main_window import RenderThread
+        from fractal_explorer.fractals import MandelbrotSet
+        from fractal_explorer.rendering import FractalRenderer2D
+        
+        levels = []
+        
+        def run_passes(stop_after=None):
+            renderer = FractalRenderer2D(MandelbrotSet(), width=160, height=120)
+            # A zero budget keeps every coarse level
+            renderer.PROGRESSIVE_BUDGET = 0.0
+            thread = RenderThread(renderer, renderer.current_bounds, {'max_iter': 100})
+            
+            def on_frame(level, image):
+                assert image.shape == (120, 160, 3)
+                levels.append(level)
+                if level == stop_after:
+                    thread.requestInterruption()
+            
+            # Handle frames on the render thread itself, as no event loop
+            # runs here to deliver them
+            thread.frame_ready.connect(on_frame, Qt.DirectConnection)
+            thread.start()
+            assert thread.wait(120000), "render thread did not finish"
+        
+        run_passes()
+        assert levels == [8, 4, 2, 1], f"unexpected passes {levels}"
+        
+        # A new request interrupts the thread; the finer passes are dropped
+        levels.clear()
+        run_passes(stop_after=4)
+        assert levels == [8, 4], f"passes after interruption: {levels}"
+        
+        print("   ✓ Passes 8, 4, 2, 1 emitted; interruption drops the rest")
+        return True
+    
+    except Exception as e:
+        print(f"   ✗ Render thread pass test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_repeat_render_skipped():
+    """Test that a render repeating the frame on the canvas is skipped."""
+    
+    print("Testing repeated render requests...")
+    
+    try:
+        from PyQt5.QtWidgets import QApplication
+        
+        app = QApplication.instance() or QApplication([])
+        
+        from fractal_explorer.ui.main_window import FractalExplorerWindow
+        
+        window = FractalExplorerWindow()
+        window._initializing = False
+        
+        # Without an event loop renders run in place
+        window._render_fractal()
+        image = window.canvas.image_data
+        window._render_fractal()
+        assert window.canvas.image_data is image, "unchanged view was rendered again"
+        
+        window.renderer.zoom(100, 100, 1.5)
+        window._render_fractal()
+        assert window.canvas.image_data is not image, "zoomed view was not rendered"
+        
+        window.close()
+        print("   ✓ Unchanged view skipped, changed view rendered")
+        return True
+    
+    except Exception as e:
+        print(f"   ✗ Repeated render test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("TESTING RENDER KEYWORD ARGUMENT FIX")
     print("=" * 60)
     
     success = test_render_fix()
+    success = test_render_thread_coalescing() and success
+    success = test_render_thread_passes() and success
+    success = test_repeat_render_skipped() and success
     
     if success:
         print("\n✓ All render tests passed!")
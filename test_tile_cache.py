@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Test script for the coordinate-aligned escape-time tile cache."""
+
+import sys
+import os
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.abspath('.'))
+
+WIDTH, HEIGHT, MAX_ITER = 150, 100, 200
+BOUNDS = (-0.8, -0.7, 0.05, 0.12)
+
+
+def snapped_view(bounds, width, height):
+    """Get the lattice the tiled path snaps a view to.
+    
+    Returns:
+        Tuple of (snapped bounds, dx, dy)
+    """
+    xmin, xmax, ymin, ymax = bounds
+    dx = float('%.12g' % ((xmax - xmin) / width))
+    dy = float('%.12g' % ((ymax - ymin) / height))
+    gx0, gy0 = round(xmin / dx), round(ymin / dy)
+    return (gx0 * dx, (gx0 + width) * dx, gy0 * dy, (gy0 + height) * dy), dx, dy
+
+
+def test_tiled_matches_snapped_view():
+    """Test that tiled renders equal a single compute over the snapped bounds."""
+    print("=" * 60)
+    print("TESTING TILED RENDERS AGAINST THE SNAPPED VIEW")
+    print("=" * 60)
+    
+    try:
+        from fractal_explorer.fractals import MandelbrotSet, JuliaSet
+        
+        snapped, _, _ = snapped_view(BOUNDS, WIDTH, HEIGHT)
+        
+        for fractal in (MandelbrotSet(), JuliaSet()):
+            params = dict(max_iter=MAX_ITER, adaptive_iter=False, use_gpu=False)
+            tiled = fractal.compute(WIDTH, HEIGHT, BOUNDS, tile_cache=True, **params)
+            single = fractal.compute(WIDTH, HEIGHT, snapped, **params)
+            assert np.array_equal(tiled, single), f"{fractal.name} tiles differ"
+            
+            # Tiles are double precision either way, so a tiled preview is
+            # the same grid, served from the same cache entry
+            preview = fractal.compute(WIDTH, HEIGHT, BOUNDS, tile_cache=True,
+                                      preview=True, **params)
+            assert preview is tiled, f"{fractal.name} preview cached separately"
+            print(f"  ✓ {fractal.name}: tiled view matches, preview shares it")
+        
+        return True
+    
+    except Exception as e:
+        print(f"✗ Tiled view test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_pan_reuses_tiles():
+    """Test that a pan only computes the tiles that scrolled into view."""
+    print("=" * 60)
+    print("TESTING TILE REUSE ACROSS A PAN")
+    print("=" * 60)
+    
+    try:
+        from fractal_explorer.fractals import MandelbrotSet
+        from fractal_explorer.fractals.escape_time import (mandelbrot_kernel,
+                                                           smooth_escape_counts)
+        
+        mandelbrot = MandelbrotSet()
+        computed = []
+        
+        def compute_tile(xs, ys):
+            computed.append((xs[0], ys[0]))
+            return smooth_escape_counts(*mandelbrot_kernel(xs, ys, MAX_ITER))
+        
+        first = mandelbrot.compute_tiled(compute_tile, WIDTH, HEIGHT, BOUNDS, (MAX_ITER,))
+        first_tiles = set(computed)
+        computed.clear()
+        
+        # Pan by whole pixels, more than a tile along x
+        _, dx, dy = snapped_view(BOUNDS, WIDTH, HEIGHT)
+        shift_x, shift_y = 70, 30
+        xmin, xmax, ymin, ymax = BOUNDS
+        panned = (xmin + shift_x * dx, xmax + shift_x * dx,
+                  ymin + shift_y * dy, ymax + shift_y * dy)
+        second = mandelbrot.compute_tiled(compute_tile, WIDTH, HEIGHT, panned, (MAX_ITER,))
+        
+        print(f"  First view: {len(first_tiles)} tiles, pan: {len(computed)} new tiles")
+        assert computed, "pan computed no tiles"
+        assert not first_tiles & set(computed), "pan recomputed a cached tile"
+        assert np.array_equal(second[:HEIGHT - shift_y, :WIDTH - shift_x],
+                              first[shift_y:, shift_x:]), "overlap moved"
+        
+        print("✓ Pan reused every tile it already had")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Tile reuse test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = test_tiled_matches_snapped_view()
+    success = test_pan_reuses_tiles() and success
+    sys.exit(0 if success else 1)
@@ -7,6 +7,9 @@ import os
 # Add the current directory to Python path
 sys.path.insert(0, os.path.abspath('.'))
 
+from testing_utils import get_test_app
+
+
 def test_ui_layout_fixes():
     """Test that UI layout improvements work."""
     print("=" * 60)
@@ -14,14 +17,7 @@ def test_ui_layout_fixes():
     print("=" * 60)
     
     try:
-        import os
-        os.environ['QT_QPA_PLATFORM'] = 'offscreen'
-        
-        from PyQt5.QtWidgets import QApplication
-        from PyQt5.QtCore import Qt
-        
-        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-        app = QApplication([])
+        app = get_test_app()
         
         print("1. Testing improved control panel layout...")
         from fractal_explorer.ui.controls import ControlPanel
@@ -47,7 +43,6 @@ def test_ui_layout_fixes():
             widget_type = type(widget).__name__
             print(f"   - {name}: {widget_type}")
         
-        app.quit()
         return True
         
     except Exception as e:
@@ -114,14 +109,7 @@ def test_all_fractal_types():
     print("=" * 60)
     
     try:
-        import os
-        os.environ['QT_QPA_PLATFORM'] = 'offscreen'
-        
-        from PyQt5.QtWidgets import QApplication
-        from PyQt5.QtCore import Qt
-        
-        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-        app = QApplication([])
+        app = get_test_app()
         
         from fractal_explorer.ui.main_window import FractalExplorerWindow
         
@@ -132,6 +120,13 @@ def test_all_fractal_types():
         fractal_names = list(window.fractals.keys())
         print(f"   Available fractals: {fractal_names}")
         
+        # Only the wiring of each fractal is checked here, not its pixels,
+        # so stand in for the render every switch requests; autospec keeps
+        # the real signature
+        from unittest import mock
+        render = mock.patch.object(window, '_render_fractal', autospec=True)
+        render_requests = render.start()
+        
         for name in fractal_names:
             try:
                 print(f"   Testing {name}...")
@@ -154,7 +149,8 @@ def test_all_fractal_types():
             except Exception as e:
                 print(f"     ✗ {name} failed: {e}")
         
-        app.quit()
+        render.stop()
+        assert render_requests.called, "switching fractals requested no render"
         return True
         
     except Exception as e:
@@ -201,6 +197,9 @@ def main():
     
     results = []
     
+    # Keep one application alive for every GUI test
+    app = get_test_app()
+    
     # Run tests
     results.append(("UI Layout Fixes", test_ui_layout_fixes()))
     results.append(("IFS Fractal Improvements", test_ifs_fractal_improvements()))
@@ -230,6 +229,7 @@ def main():
     # Print improvement summary
     print_improvement_summary()
     
+    app.quit()
     return passed == len(results)
 
 
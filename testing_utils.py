@@ -0,0 +1,37 @@
+"""Helpers shared by the test scripts."""
+
+import os
+
+
+def get_test_app():
+    """Get the offscreen QApplication shared by the GUI tests.
+    
+    Qt's platform and style setup runs once, when the first test creates
+    the application; later tests reuse it.
+    """
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt
+    
+    app = QApplication.instance()
+    if app is None:
+        # High DPI attributes only take effect before the application exists
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+        app = QApplication([])
+    return app
+
+
+def warmup_kernels(fractal_classes):
+    """Compile the kernels once so the tests measure steady-state renders.
+    
+    Args:
+        fractal_classes: Fractal classes whose kernels the tests use
+    """
+    from fractal_explorer.rendering.colormaps import ColorMapper
+    
+    # Kernels are cached on disk, so after the first run this only loads them
+    for fractal_class in fractal_classes:
+        fractal_class().warmup()
+    ColorMapper.warmup()